@@ -1,9 +1,10 @@
 """Simplified API client with improved separation of concerns."""
 
+import json
 import re
 import time
 import requests
-from typing import Dict, Any, Optional, List, Generator, Tuple
+from typing import Dict, Any, Optional, List, Generator, Tuple, Union
 from dataclasses import dataclass
 from rich.console import Console
 
@@ -18,6 +19,21 @@ from ..utils.retry import (
 )
 from ..utils.pagination import CursorPaginationHelper, PaginationHelper
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - ships with the langsmith SDK
+    orjson = None
+
+
+# Connections kept per host. requests' default of 10 is below what the
+# migrators use at once: run uploads alongside a prefetched /runs/query page
+# take concurrent_workers + 1, and parallel datasets fan out example updates.
+# Those nest (datasets x updates per dataset), so DatasetMigrator divides this
+# budget between the datasets running together rather than assuming it covers
+# the product. Past the pool size urllib3 discards connections and every extra
+# request pays a new TLS handshake.
+HTTP_POOL_MAXSIZE = 32
+
 
 class NotFoundError(APIError):
     """Resource not found error."""
@@ -44,6 +60,43 @@ def sanitize_upstream_text(text: Optional[str], limit: int = 200) -> str:
     return cleaned[:limit] + "..." if len(cleaned) > limit else cleaned
 
 
+def decode_json_body(response: requests.Response) -> Any:
+    """Decode a JSON response body.
+
+    Parses the raw bytes with orjson when available, which skips the
+    intermediate ``str`` that ``Response.json()`` builds and is markedly
+    faster on large list pages. Bodies orjson rejects (e.g. non-UTF-8
+    encodings) go through ``Response.json()``, which raises ``ValueError``
+    if they are not JSON at all.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except ValueError:
+            pass
+    return response.json()
+
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+def encode_json_body(data: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON bytes.
+
+    Bulk bodies (``/examples/bulk``, ``/runs/batch``) can run to tens of MB,
+    and orjson encodes them in a single C pass straight to bytes, where
+    ``requests``' ``json=`` goes through stdlib ``json`` and then a separate
+    str-to-bytes encode. Values orjson refuses (e.g. integers wider than 64
+    bits) fall back to stdlib ``json``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data, allow_nan=False).encode("utf-8")
+
+
 @dataclass
 class BatchItemResult:
     """Result for a single item in a batch operation."""
@@ -144,8 +197,12 @@ class EnhancedAPIClient:
         self.request_count = 0
         self.error_count = 0
 
-        # Session for connection pooling
+        # Session for connection pooling; source and destination clients
+        # each get their own session, so their pools never compete.
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(headers)
         self.session.verify = verify_ssl
 
@@ -307,7 +364,7 @@ class EnhancedAPIClient:
 
         # Success - parse JSON response
         try:
-            json_response = response.json()
+            json_response = decode_json_body(response)
             # Validate response is dict or list as expected
             if json_response is None:
                 return {}
@@ -346,13 +403,13 @@ class EnhancedAPIClient:
         return self._handle_response(response, endpoint)
 
     @retry_on_failure(max_retries=3)
-    def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def post(self, endpoint: str, data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
         """
         Make a POST request.
 
         Args:
             endpoint: API endpoint
-            data: JSON data to send
+            data: JSON data to send, or a body already encoded as JSON bytes
 
         Returns:
             JSON response as dictionary
@@ -366,7 +423,12 @@ class EnhancedAPIClient:
         if self.rate_limit_delay > 0:
             time.sleep(self.rate_limit_delay)
 
-        response = self.session.post(url, json=data, timeout=self.timeout)
+        response = self.session.post(
+            url,
+            data=data if isinstance(data, bytes) else encode_json_body(data),
+            headers=_JSON_CONTENT_TYPE,
+            timeout=self.timeout,
+        )
         return self._handle_response(response, endpoint)
 
     @retry_upstream_rejections(max_retries=3)
@@ -1,20 +1,40 @@
 """Dataset migration logic."""
 
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Generator, Tuple
 import requests
 import tempfile
 import os
 import json
 import hashlib
+import queue
+import threading
 import urllib3
+from langsmith import Client
+from langsmith.schemas import Attachment
 
 from .base import BaseMigrator
-from ..api_client import APIError, NotFoundError
+from ..api_client import HTTP_POOL_MAXSIZE, APIError, NotFoundError
+
+try:
+    import orjson
+    import xxhash
+except ImportError:  # pragma: no cover - both ship with the langsmith SDK
+    orjson = None
+    xxhash = None
 
 
 # Maximum attachment size in bytes (100 MB)
 MAX_ATTACHMENT_SIZE_BYTES = 100 * 1024 * 1024
 
+# Most attachment bytes sent in a single SDK create_examples call
+SDK_UPLOAD_BYTE_BUDGET = MAX_ATTACHMENT_SIZE_BYTES
+
+# Number of ready batches the example reader may run ahead of the writer
+EXAMPLE_PIPELINE_DEPTH = 2
+
 # Allowed MIME types for attachments (add more as needed)
 ALLOWED_ATTACHMENT_TYPES = {
     'application/octet-stream',
@@ -33,20 +53,78 @@ ALLOWED_ATTACHMENT_TYPES = {
 }
 
 
+def _copy_present(payload: Dict[str, Any], source: Dict[str, Any], keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """Copy ``keys`` from ``source`` into ``payload``, skipping None values."""
+    for key in keys:
+        value = source.get(key)
+        if value is not None:
+            payload[key] = value
+    return payload
+
+
+@dataclass(slots=True)
+class BatchedExample:
+    """A new example waiting in a batch for creation in the destination."""
+    original_id: str
+    payload: Dict[str, Any]
+    # name -> (mime_type, temp_file_path, original_filename, size_bytes)
+    attachments: Dict[str, Tuple[str, str, str, int]]
+
+
 class DatasetMigrator(BaseMigrator):
     """Handles dataset migration with streaming and batching."""
 
+    def __init__(self, source_client, dest_client, state, config):
+        super().__init__(source_client, dest_client, state, config)
+        # Destination SDK client for attachment uploads, built on first use and
+        # shared by every batch (the orchestrator runs datasets in parallel
+        # threads on one migrator, hence the lock).
+        self._ls_client: Optional[Client] = None
+        self._ls_client_lock = threading.Lock()
+        # How many datasets share this migrator at once. Each one's update
+        # pool gets an equal share of the destination connection pool.
+        self.parallel_datasets = 1
+
+        if not config.source.verify_ssl or not config.destination.verify_ssl:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    def _get_ls_client(self) -> Client:
+        """Return the destination LangSmith SDK client, creating it once."""
+        with self._ls_client_lock:
+            if self._ls_client is not None:
+                return self._ls_client
+
+            # SDK expects base URL without /api/v1 suffix
+            sdk_url = self.dest.base_url.replace("/api/v1", "")
+            api_key = self.dest.headers.get("X-API-Key") or self.dest.headers.get("x-api-key", "")
+
+            client_kwargs = {
+                "api_url": sdk_url,
+                "api_key": api_key,
+                "info": {}  # Skip automatic /info fetch to avoid compatibility issues
+            }
+
+            # Add custom session with SSL verification disabled if needed
+            if not self.config.destination.verify_ssl:
+                session = requests.Session()
+                session.verify = False
+                client_kwargs["session"] = session
+
+                self.log("SSL verification disabled for LangSmith SDK client", "info")
+
+            self._ls_client = Client(**client_kwargs)
+            return self._ls_client
+
     def list_datasets(self) -> List[Dict[str, Any]]:
         """List all datasets from source."""
-        datasets = []
-        count = 0
-        for dataset in self.source.get_paginated("/datasets", page_size=100):
-            if isinstance(dataset, dict):
-                datasets.append(dataset)
-                count += 1
+        datasets = [
+            dataset
+            for dataset in self.source.get_paginated("/datasets", page_size=100)
+            if isinstance(dataset, dict)
+        ]
 
         if self.config.migration.verbose:
-            self.log(f"Fetched {count} datasets from source", "info")
+            self.log(f"Fetched {len(datasets)} datasets from source", "info")
 
         return datasets
 
@@ -74,28 +152,51 @@ class DatasetMigrator(BaseMigrator):
 
         return None
 
-    def _hash_inputs(self, inputs: Dict[str, Any]) -> str:
-        """Create a stable hash of example inputs for matching."""
+    def _hash_inputs(self, inputs: Dict[str, Any]) -> bytes:
+        """Create a stable hash of example inputs for matching.
+
+        The hash is only a match key within one run, so it needs no
+        cryptographic strength: xxh128 over sorted-key orjson bytes when
+        available, else sorted ``json.dumps`` + SHA-256. Raw digests are
+        returned to keep the destination index small.
+        """
+        if orjson is not None and xxhash is not None:
+            try:
+                serialized = orjson.dumps(
+                    inputs,
+                    default=str,
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                )
+                return xxhash.xxh128_digest(serialized)
+            except TypeError:
+                # orjson rejects e.g. integers wider than 64 bits
+                pass
         # Sort keys to ensure consistent ordering
         serialized = json.dumps(inputs, sort_keys=True, default=str)
-        return hashlib.sha256(serialized.encode()).hexdigest()
+        return hashlib.sha256(serialized.encode(), usedforsecurity=False).digest()
 
-    def get_existing_examples(self, dataset_id: str) -> Dict[str, Dict[str, Any]]:
+    def get_existing_examples(self, dataset_id: str) -> Dict[bytes, str]:
         """
         Get existing examples from destination dataset, indexed by inputs hash.
 
+        Only the example ID is kept per entry; the upsert decision never reads
+        the rest of the example, and holding full example dicts for a large
+        destination dataset costs far more memory than the index itself.
+
         Returns:
-            Dict mapping inputs_hash -> example dict (with id, inputs, outputs, metadata)
+            Dict mapping inputs_hash -> destination example ID
         """
         existing = {}
+        # Only id and inputs are read. Selecting outputs/metadata here would
+        # transfer and parse them just to discard.
         params = {
             "dataset": dataset_id,
-            "select": ["inputs", "outputs", "metadata"]
+            "select": ["id", "inputs"]
         }
         for example in self.dest.get_paginated("/examples", params=params):
-            if isinstance(example, dict) and example.get("inputs"):
+            if isinstance(example, dict) and example.get("inputs") and example.get("id"):
                 inputs_hash = self._hash_inputs(example["inputs"])
-                existing[inputs_hash] = example
+                existing[inputs_hash] = example["id"]
         return existing
 
     def update_example(self, example_id: str, example_data: Dict[str, Any]) -> None:
@@ -104,13 +205,7 @@ class DatasetMigrator(BaseMigrator):
             self.log(f"[DRY RUN] Would update example: {example_id}")
             return
 
-        payload = {
-            "inputs": example_data.get("inputs"),
-            "outputs": example_data.get("outputs"),
-            "metadata": example_data.get("metadata"),
-        }
-        # Remove None values
-        payload = {k: v for k, v in payload.items() if v is not None}
+        payload = _copy_present({}, example_data, ("inputs", "outputs", "metadata"))
 
         self.dest.patch(f"/examples/{example_id}", payload)
 
@@ -120,17 +215,15 @@ class DatasetMigrator(BaseMigrator):
             self.log(f"[DRY RUN] Would update dataset: {dataset['name']} ({dataset_id})")
             return
 
-        payload = {
-            "name": dataset["name"],
-            "description": dataset.get("description") or "",
-            "inputs_schema_definition": dataset.get("inputs_schema_definition"),
-            "outputs_schema_definition": dataset.get("outputs_schema_definition"),
-            "transformations": dataset.get("transformations") or [],
-            "metadata": dataset.get("metadata"),
-        }
-
-        # Remove None values
-        payload = {k: v for k, v in payload.items() if v is not None}
+        payload = _copy_present(
+            {
+                "name": dataset["name"],
+                "description": dataset.get("description") or "",
+                "transformations": dataset.get("transformations") or [],
+            },
+            dataset,
+            ("inputs_schema_definition", "outputs_schema_definition", "metadata"),
+        )
 
         self.dest.patch(f"/datasets/{dataset_id}", payload)
         self.log(f"Updated dataset: {dataset['name']} ({dataset_id})", "success")
@@ -141,20 +234,20 @@ class DatasetMigrator(BaseMigrator):
             self.log(f"[DRY RUN] Would create dataset: {dataset['name']}")
             return f"dry-run-{dataset['id']}"
 
-        payload = {
-            "name": dataset["name"],
-            "description": dataset.get("description") or "",
-            "created_at": dataset.get("created_at"),
-            "inputs_schema_definition": dataset.get("inputs_schema_definition"),
-            "outputs_schema_definition": dataset.get("outputs_schema_definition"),
-            "externally_managed": dataset.get("externally_managed", False),
-            "transformations": dataset.get("transformations") or [],
-            "data_type": dataset.get("data_type", "kv"),
-            "metadata": dataset.get("metadata"),
-        }
-
-        # Remove None values
-        payload = {k: v for k, v in payload.items() if v is not None}
+        payload = _copy_present(
+            {
+                "name": dataset["name"],
+                "description": dataset.get("description") or "",
+                "transformations": dataset.get("transformations") or [],
+            },
+            dataset,
+            ("created_at", "inputs_schema_definition", "outputs_schema_definition", "metadata"),
+        )
+        # Absent fields take the server defaults; an explicit null is left out
+        for key, default in (("externally_managed", False), ("data_type", "kv")):
+            value = dataset.get(key, default)
+            if value is not None:
+                payload[key] = value
 
         response = self.dest.post("/datasets", payload)
 
@@ -176,7 +269,7 @@ class DatasetMigrator(BaseMigrator):
         for example in self.source.get_paginated("/examples", params=params):
             yield example
 
-    def download_attachments(self, attachments: Dict[str, Any]) -> Dict[str, Tuple[str, str, str]]:
+    def download_attachments(self, attachments: Dict[str, Any]) -> Dict[str, Tuple[str, str, str, int]]:
         """
         Download attachments from source to temporary files.
 
@@ -189,7 +282,8 @@ class DatasetMigrator(BaseMigrator):
             attachments: Dictionary of attachment URLs from source example
 
         Returns:
-            Dictionary mapping attachment names to (mime_type, temp_file_path, original_filename) tuples
+            Dictionary mapping attachment names to
+            (mime_type, temp_file_path, original_filename, size_bytes) tuples
         """
         if not attachments:
             return {}
@@ -208,10 +302,6 @@ class DatasetMigrator(BaseMigrator):
                     self.log(f"No presigned URL for attachment '{key}', skipping", "warning")
                     continue
 
-                # Suppress SSL warnings if verification is disabled
-                if not self.source.verify_ssl:
-                    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
                 # First, make a HEAD request to check size and content-type
                 try:
                     head_response = requests.head(
@@ -280,8 +370,9 @@ class DatasetMigrator(BaseMigrator):
                             pass
                         raise
 
-                # Verify download size matches Content-Length if provided
-                actual_size = os.path.getsize(temp_path)
+                # Verify download size matches Content-Length if provided. The
+                # streaming loop already counted every byte it wrote.
+                actual_size = bytes_written
                 expected_size = response.headers.get('Content-Length')
                 if expected_size and int(expected_size) != actual_size:
                     self.log(
@@ -296,9 +387,11 @@ class DatasetMigrator(BaseMigrator):
                 # Extract filename from key by removing 'attachment.' prefix
                 original_filename = key.replace("attachment.", "", 1) if key.startswith("attachment.") else key
 
-                # Store as tuple of (mime_type, temp_file_path, original_filename)
-                downloaded[key] = (content_type, temp_path, original_filename)
-                self.log(f"Downloaded attachment '{key}' ({actual_size} bytes)", "info")
+                # Keep the byte count with the path so upload grouping need
+                # not stat the file again
+                downloaded[key] = (content_type, temp_path, original_filename, actual_size)
+                if self.config.migration.verbose:
+                    self.log(f"Downloaded attachment '{key}' ({actual_size} bytes)", "info")
 
             except requests.exceptions.Timeout:
                 self.log(f"Timeout downloading attachment '{key}'", "error")
@@ -371,9 +464,7 @@ class DatasetMigrator(BaseMigrator):
                         continue
 
                     # Upload attachment data to presigned URL
-                    # Suppress SSL warnings if verification is disabled
                     if not self.dest.verify_ssl:
-                        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
                         if not hasattr(self, '_ssl_warning_shown'):
                             self.log("SSL verification disabled for attachment uploads", "warning")
                             self._ssl_warning_shown = True
@@ -402,151 +493,195 @@ class DatasetMigrator(BaseMigrator):
     def create_examples_with_attachments(
         self,
         dataset_id: str,
-        examples_with_attachments: List[Tuple[str, Dict[str, Any], Dict[str, Tuple[str, str, str]]]]
+        examples_with_attachments: List[BatchedExample]
     ) -> Dict[str, str]:
         """
         Create examples with attachments using LangSmith SDK.
 
+        Examples are uploaded several per ``create_examples`` call, grouped so
+        each call carries at most ``SDK_UPLOAD_BYTE_BUDGET`` bytes of
+        attachment data. If a grouped call fails, its examples are retried one
+        at a time so a single bad example does not take the rest down with it.
+
         Args:
             dataset_id: Destination dataset ID
-            examples_with_attachments: List of (original_id, example_data, attachments) tuples
-                where attachments is Dict[key, (mime_type, temp_file_path, filename)]
+            examples_with_attachments: Batched examples whose attachments map
+                key -> (mime_type, temp_file_path, filename, size_bytes)
 
         Returns:
             Dictionary mapping original_id to new example ID
         """
-        try:
-            from langsmith import Client
-            from langsmith.schemas import Attachment
-        except ImportError:
-            self.log("LangSmith SDK not installed. Install with: pip install langsmith", "error")
-            raise
-
-        # Initialize LangSmith client with destination credentials
-        # SDK expects base URL without /api/v1 suffix
-        sdk_url = self.dest.base_url.replace("/api/v1", "")
-        api_key = self.dest.headers.get("X-API-Key") or self.dest.headers.get("x-api-key", "")
-
-        # Create client kwargs
-        client_kwargs = {
-            "api_url": sdk_url,
-            "api_key": api_key,
-            "info": {}  # Skip automatic /info fetch to avoid compatibility issues
-        }
+        client = self._get_ls_client()
+        verbose = self.config.migration.verbose
 
-        # Add custom session with SSL verification disabled if needed
-        if not self.config.destination.verify_ssl:
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        id_mapping = {}
 
-            # Create session with SSL verification disabled
-            session = requests.Session()
-            session.verify = False
-            client_kwargs["session"] = session
+        for chunk in self._chunk_by_attachment_bytes(examples_with_attachments):
+            # Temp files for this chunk are removed when the block exits, however it exits
+            with contextlib.ExitStack() as cleanup:
+                prepared = []
+                for batched in chunk:
+                    # Convert attachment tuples to SDK Attachment objects
+                    # Use the original filename to preserve the file extension
+                    sdk_attachments = {}
+                    for att_name, (mime_type, temp_path, original_filename, _) in batched.attachments.items():
+                        cleanup.callback(self._remove_temp_file, temp_path)
+                        try:
+                            with open(temp_path, "rb") as f:
+                                data = f.read()
 
-            self.log("SSL verification disabled for LangSmith SDK client", "info")
+                            # Use the original filename which should include the extension
+                            sdk_attachments[original_filename] = Attachment(
+                                mime_type=mime_type,
+                                data=data
+                            )
+                            if verbose:
+                                self.log(f"Mapping attachment: {att_name} -> {original_filename} ({mime_type})", "info")
+                        except Exception as e:
+                            self.log(f"Failed to read attachment file {temp_path}: {e}", "error")
+                            continue
 
-        client = Client(**client_kwargs)
+                    prepared.append((batched.original_id, {
+                        "inputs": batched.payload.get("inputs", {}),
+                        "outputs": batched.payload.get("outputs", {}),
+                        "metadata": batched.payload.get("metadata", {}),
+                        "attachments": sdk_attachments,
+                    }))
 
-        id_mapping = {}
+                self._upload_sdk_examples(client, dataset_id, prepared, id_mapping)
 
-        # Process examples one at a time due to SDK limitations
-        for original_id, example_data, attachments in examples_with_attachments:
-            temp_files_to_cleanup = []
-            try:
-                # Convert attachment tuples to SDK Attachment objects
-                # Use the original filename to preserve the file extension
-                sdk_attachments = {}
-                for att_name, (mime_type, temp_path, original_filename) in attachments.items():
-                    try:
-                        temp_files_to_cleanup.append(temp_path)
-                        with open(temp_path, "rb") as f:
-                            data = f.read()
-
-                        # Use the original filename which should include the extension
-                        sdk_attachments[original_filename] = Attachment(
-                            mime_type=mime_type,
-                            data=data
-                        )
-                        self.log(f"Mapping attachment: {att_name} -> {original_filename} ({mime_type})", "info")
-                    except Exception as e:
-                        self.log(f"Failed to read attachment file {temp_path}: {e}", "error")
-                        continue
-
-                # Create example with attachments using SDK
-                example_dict = {
-                    "inputs": example_data.get("inputs", {}),
-                    "outputs": example_data.get("outputs", {}),
-                    "metadata": example_data.get("metadata", {}),
-                    "attachments": sdk_attachments,
-                }
+        return id_mapping
 
-                # Use SDK to create example
-                self.log(f"Creating example with {len(sdk_attachments)} attachment(s)...", "info")
-                created_examples = client.create_examples(
+    def _remove_temp_file(self, path: str) -> None:
+        """Delete a downloaded attachment file; a file that is already gone is fine."""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.log(f"Failed to remove temp file {path}: {e}", "warning")
+
+    def _chunk_by_attachment_bytes(
+        self, examples: List[BatchedExample]
+    ) -> Generator[List[BatchedExample], None, None]:
+        """Group examples so each group's attachment files fit the SDK upload budget."""
+        chunk: List[BatchedExample] = []
+        chunk_bytes = 0
+        for example in examples:
+            # Sizes were counted while the files were downloaded
+            size = sum(attachment[3] for attachment in example.attachments.values())
+            if chunk and chunk_bytes + size > SDK_UPLOAD_BYTE_BUDGET:
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(example)
+            chunk_bytes += size
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _created_example_ids(created_examples: Any) -> List[str]:
+        """Extract new example IDs, in upload order, from an SDK create_examples response."""
+        if isinstance(created_examples, dict):
+            # SDK returned dict format: {'example_ids': [...], 'count': N}
+            return [str(example_id) for example_id in created_examples.get("example_ids") or []]
+        # SDK returned list of objects
+        return [str(example.id) for example in created_examples or []]
+
+    def _upload_sdk_examples(
+        self,
+        client: Client,
+        dataset_id: str,
+        prepared: List[Tuple[str, Dict[str, Any]]],
+        id_mapping: Dict[str, str],
+    ) -> None:
+        """Create ``(original_id, example_dict)`` pairs with one SDK call, splitting on failure."""
+        self.log(f"Creating {len(prepared)} example(s) with attachments...", "info")
+        try:
+            new_ids = self._created_example_ids(
+                client.create_examples(
                     dataset_id=dataset_id,
-                    examples=[example_dict]
+                    examples=[example_dict for _, example_dict in prepared]
                 )
-
-                self.log(f"SDK returned: {type(created_examples)} with value: {created_examples}", "info")
-
-                # Handle both dict response and list response from SDK
-                if isinstance(created_examples, dict):
-                    # SDK returned dict format: {'example_ids': [...], 'count': N}
-                    example_ids = created_examples.get('example_ids', [])
-                    if example_ids:
-                        new_id = example_ids[0]
-                        id_mapping[original_id] = str(new_id)
-                        self.log(f"Created example with attachments: {original_id} -> {new_id}", "success")
-                    else:
-                        self.log(f"SDK returned dict but no example_ids for {original_id}", "error")
-                elif created_examples and len(created_examples) > 0:
-                    # SDK returned list of objects
-                    new_id = created_examples[0].id
-                    id_mapping[original_id] = str(new_id)
-                    self.log(f"Created example with attachments: {original_id} -> {new_id}", "success")
-                else:
-                    self.log(f"SDK returned empty or invalid response for {original_id}", "error")
-
-            except Exception as e:
-                import traceback
-                error_str = str(e)
-
-                # Check if it's a 405 error (endpoint not allowed)
-                if "405" in error_str or "Not Allowed" in error_str:
-                    self.log(f"Bulk endpoint not allowed, falling back to individual creation for {original_id}", "warning")
-
-                    # Fall back to individual example creation
-                    try:
-                        # Convert SDK Attachment objects to (mime_type, data) tuples
-                        attachment_tuples = {}
-                        for att_name, attachment_obj in sdk_attachments.items():
-                            attachment_tuples[att_name] = (attachment_obj.mime_type, attachment_obj.data)
-
-                        new_id = self._create_example_individual_with_attachments(
-                            dataset_id,
-                            example_data,
-                            attachment_tuples
-                        )
-                        if new_id:
-                            id_mapping[original_id] = str(new_id)
-                            self.log(f"Created example with attachments (fallback): {original_id} -> {new_id}", "success")
-                    except Exception as fallback_error:
-                        self.log(f"Fallback creation also failed for {original_id}: {fallback_error}", "error")
+            )
+        except Exception as e:
+            import traceback
+            error_str = str(e)
+
+            # Check if it's a 405 error (endpoint not allowed)
+            if "405" in error_str or "Not Allowed" in error_str:
+                self.log("Bulk endpoint not allowed, falling back to individual creation", "warning")
+                for original_id, example_dict in prepared:
+                    self._create_example_fallback(dataset_id, original_id, example_dict, id_mapping)
+            elif len(prepared) > 1:
+                self.log(
+                    f"Batched upload of {len(prepared)} examples failed ({e}), retrying one at a time",
+                    "warning"
+                )
+                # A timeout or 5xx can arrive after the group was written, so
+                # map anything that now exists instead of creating it again.
+                try:
+                    existing = self.get_existing_examples(dataset_id)
+                except Exception as lookup_error:
+                    self.log(
+                        f"Could not re-check destination examples ({lookup_error}); "
+                        "leaving this group unmapped",
+                        "error"
+                    )
+                    return
+                for entry in prepared:
+                    original_id, example_dict = entry
+                    existing_id = existing.get(self._hash_inputs(example_dict.get("inputs") or {}))
+                    if existing_id:
+                        id_mapping[original_id] = existing_id
                         continue
-                else:
-                    self.log(f"Failed to create example {original_id} with attachments: {e}", "error")
+                    self._upload_sdk_examples(client, dataset_id, [entry], id_mapping)
+            else:
+                self.log(f"Failed to create example {prepared[0][0]} with attachments: {e}", "error")
+                if self.config.migration.verbose:
                     self.log(f"Traceback: {traceback.format_exc()}", "error")
-                    continue
-            finally:
-                # Clean up temp files for this example
-                for path in temp_files_to_cleanup:
-                    try:
-                        if os.path.exists(path):
-                            os.remove(path)
-                    except Exception as e:
-                        self.log(f"Failed to remove temp file {path}: {e}", "warning")
+            return
 
-        return id_mapping
+        if len(new_ids) != len(prepared):
+            # Without a one-to-one response the pairing is ambiguous, and retrying
+            # could duplicate examples that were in fact created.
+            self.log(
+                f"SDK returned {len(new_ids)} example ID(s) for {len(prepared)} example(s); "
+                "leaving this group unmapped",
+                "error"
+            )
+            return
+
+        verbose = self.config.migration.verbose
+        for (original_id, _), new_id in zip(prepared, new_ids):
+            id_mapping[original_id] = new_id
+            if verbose:
+                self.log(f"Created example with attachments: {original_id} -> {new_id}", "success")
+
+    def _create_example_fallback(
+        self,
+        dataset_id: str,
+        original_id: str,
+        example_dict: Dict[str, Any],
+        id_mapping: Dict[str, str],
+    ) -> None:
+        """Create one example through the direct API when the SDK bulk endpoint is unavailable."""
+        try:
+            # Convert SDK Attachment objects to (mime_type, data) tuples
+            attachment_tuples = {}
+            for att_name, attachment_obj in example_dict["attachments"].items():
+                attachment_tuples[att_name] = (attachment_obj.mime_type, attachment_obj.data)
+
+            new_id = self._create_example_individual_with_attachments(
+                dataset_id,
+                example_dict,
+                attachment_tuples
+            )
+            if new_id:
+                id_mapping[original_id] = str(new_id)
+                self.log(f"Created example with attachments (fallback): {original_id} -> {new_id}", "success")
+        except Exception as fallback_error:
+            self.log(f"Fallback creation also failed for {original_id}: {fallback_error}", "error")
 
     def migrate_examples_streaming(
         self,
@@ -570,7 +705,6 @@ class DatasetMigrator(BaseMigrator):
             return {}
 
         id_mapping = {}
-        batch = []
         batch_count = 0
         total_migrated = 0
         total_updated = 0
@@ -584,93 +718,207 @@ class DatasetMigrator(BaseMigrator):
             if existing_examples:
                 self.log(f"Found {len(existing_examples)} existing examples in destination", "info")
 
-        for example in self.stream_examples(source_dataset_id):
-            # Debug: log example data
-            if self.config.migration.verbose:
-                self.log(f"Example {example['id']} has outputs: {bool(example.get('outputs'))}", "info")
-                if example.get("outputs"):
-                    self.log(f"Outputs content: {example.get('outputs')}", "info")
-
-            source_inputs = example.get("inputs", {})
-            inputs_hash = self._hash_inputs(source_inputs) if upsert else None
+        # Reading the source (and downloading attachments) runs on a producer
+        # thread so it overlaps with the destination writes done here.
+        work: "queue.Queue[Optional[Tuple[str, list]]]" = queue.Queue(
+            maxsize=EXAMPLE_PIPELINE_DEPTH
+        )
+        stop = threading.Event()
+        producer_errors: List[BaseException] = []
+        producer = threading.Thread(
+            target=self._produce_example_batches,
+            args=(
+                source_dataset_id,
+                dest_dataset_id,
+                existing_examples if upsert else None,
+                work,
+                stop,
+                producer_errors,
+            ),
+            name=f"examples-{source_dataset_id}",
+            daemon=True,
+        )
+        producer.start()
 
-            # Check if this example already exists in destination (by inputs hash)
-            if upsert and inputs_hash in existing_examples:
-                existing = existing_examples[inputs_hash]
-                existing_id = existing.get("id")
-
-                # Update the existing example
-                try:
-                    self.update_example(existing_id, {
-                        "inputs": source_inputs,
-                        "outputs": example.get("outputs", {}),
-                        "metadata": example.get("metadata", {}),
-                    })
-                    id_mapping[example["id"]] = existing_id
-                    total_updated += 1
-                    total_migrated += 1
-                    if self.config.migration.verbose:
-                        self.log(f"Updated existing example: {example['id']} -> {existing_id}", "info")
-                except Exception as e:
-                    self.log(f"Failed to update example {existing_id}: {e}", "error")
+        try:
+            while True:
+                entry = work.get()
+                if entry is None:
+                    break
+                kind, items = entry
+
+                if kind == "update":
+                    updated = self._apply_example_updates(items, id_mapping)
+                    total_updated += updated
+                    total_migrated += updated
+                else:
+                    batch_count += 1
+                    self.log(f"Processing batch {batch_count} ({len(items)} new examples)")
+                    created = self._process_example_batch(dest_dataset_id, items, id_mapping)
+                    total_created += created
+                    total_migrated += created
 
                 if progress_callback:
                     progress_callback(total_migrated)
-                continue
+        finally:
+            stop.set()
+            producer.join()
 
-            # Download attachments if present (only for new examples)
-            downloaded_attachments = {}
-            attachment_urls = example.get("attachment_urls")
-            if attachment_urls:
-                self.log(f"Found attachments in example {example['id']}: {list(attachment_urls.keys())}")
-                downloaded_attachments = self.download_attachments(attachment_urls)
-                if downloaded_attachments:
-                    self.log(f"Successfully downloaded {len(downloaded_attachments)} attachment(s)", "success")
-                else:
-                    self.log("No attachments were downloaded", "warning")
-
-            # Prepare example for destination
-            migrated_example = {
-                "dataset_id": dest_dataset_id,
-                "inputs": source_inputs,
-                "outputs": example.get("outputs", {}),
-                "metadata": example.get("metadata", {}),
-                "created_at": example.get("created_at"),
-                "split": ((example.get("metadata") or {}).get("dataset_split") or "base")
-            }
+        if producer_errors:
+            raise producer_errors[0]
 
-            batch.append((example["id"], migrated_example, downloaded_attachments))
+        self.log(f"Migration complete: {total_created} created, {total_updated} updated ({total_migrated} total)", "success")
+        return id_mapping
 
-            # Process batch when it reaches configured size
-            if len(batch) >= self.config.migration.batch_size:
-                batch_count += 1
-                self.log(f"Processing batch {batch_count} ({len(batch)} new examples)")
+    def _produce_example_batches(
+        self,
+        source_dataset_id: str,
+        dest_dataset_id: str,
+        existing_examples: Optional[Dict[bytes, str]],
+        work: "queue.Queue[Optional[Tuple[str, list]]]",
+        stop: threading.Event,
+        errors: List[BaseException],
+    ) -> None:
+        """
+        Stream source examples into ``work`` as ready-to-write batches.
 
-                created = self._process_example_batch(dest_dataset_id, batch, id_mapping)
-                total_created += created
-                total_migrated += created
+        Entries are ``("update", [(source_id, existing_id, example_data), ...])``
+        for upsert matches and ``("create", [BatchedExample, ...])``
+        for new examples, followed by a ``None`` sentinel. Exceptions are
+        collected into ``errors`` for the consumer to re-raise.
+        """
+        batch_size = self.config.migration.batch_size
+        verbose = self.config.migration.verbose
 
-                if progress_callback:
-                    progress_callback(total_migrated)
+        def put(entry: Optional[Tuple[str, list]]) -> bool:
+            while not stop.is_set():
+                try:
+                    work.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
 
-                batch.clear()
+        updates: List[Tuple[str, str, Dict[str, Any]]] = []
+        batch: List[BatchedExample] = []
+        try:
+            for example in self.stream_examples(source_dataset_id):
+                if stop.is_set():
+                    return
+
+                # The decoded source subtrees are handed to the destination
+                # payload as-is; nothing below copies or re-packs them.
+                source_inputs = example.get("inputs", {})
+                source_outputs = example.get("outputs", {})
+                source_metadata = example.get("metadata", {})
+
+                # Debug: log example data
+                if verbose:
+                    self.log(f"Example {example['id']} has outputs: {bool(source_outputs)}", "info")
+                    if source_outputs:
+                        self.log(f"Outputs content: {source_outputs}", "info")
+
+                # Check if this example already exists in destination (by inputs hash)
+                if existing_examples is not None:
+                    existing_id = existing_examples.get(self._hash_inputs(source_inputs))
+                    if existing_id is not None:
+                        updates.append((example["id"], existing_id, {
+                            "inputs": source_inputs,
+                            "outputs": source_outputs,
+                            "metadata": source_metadata,
+                        }))
+                        if len(updates) >= batch_size:
+                            if not put(("update", updates)):
+                                return
+                            updates = []
+                        continue
 
-        # Process remaining examples
-        if batch:
-            created = self._process_example_batch(dest_dataset_id, batch, id_mapping)
-            total_created += created
-            total_migrated += created
+                # Download attachments if present (only for new examples)
+                downloaded_attachments = {}
+                attachment_urls = example.get("attachment_urls")
+                if attachment_urls:
+                    if verbose:
+                        self.log(f"Found attachments in example {example['id']}: {list(attachment_urls)}")
+                    downloaded_attachments = self.download_attachments(attachment_urls)
+                    if downloaded_attachments:
+                        if verbose:
+                            self.log(f"Successfully downloaded {len(downloaded_attachments)} attachment(s)", "success")
+                    else:
+                        self.log("No attachments were downloaded", "warning")
+
+                # Prepare example for destination
+                migrated_example = {
+                    "dataset_id": dest_dataset_id,
+                    "inputs": source_inputs,
+                    "outputs": source_outputs,
+                    "metadata": source_metadata,
+                    "created_at": example.get("created_at"),
+                    "split": ((source_metadata or {}).get("dataset_split") or "base")
+                }
 
-            if progress_callback:
-                progress_callback(total_migrated)
+                batch.append(BatchedExample(example["id"], migrated_example, downloaded_attachments))
+
+                # Hand off the batch when it reaches configured size
+                if len(batch) >= batch_size:
+                    if not put(("create", batch)):
+                        return
+                    batch = []
+
+            # Hand off remaining examples
+            if updates and not put(("update", updates)):
+                return
+            if batch and not put(("create", batch)):
+                return
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            put(None)
+
+    def _apply_example_updates(
+        self,
+        updates: List[Tuple[str, str, Dict[str, Any]]],
+        id_mapping: Dict[str, str],
+    ) -> int:
+        """
+        Apply upsert matches to existing destination examples.
 
-        self.log(f"Migration complete: {total_created} created, {total_updated} updated ({total_migrated} total)", "success")
-        return id_mapping
+        Returns:
+            Number of examples successfully updated
+        """
+        if not updates:
+            return 0
+
+        # Each PATCH is an independent round-trip, so fan them out over the
+        # client's pooled session instead of waiting on one at a time.
+        updated_count = 0
+        verbose = self.config.migration.verbose
+        workers = max(1, min(
+            self.config.migration.concurrent_workers,
+            HTTP_POOL_MAXSIZE // max(1, self.parallel_datasets),
+            len(updates),
+        ))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.update_example, existing_id, example_data): (source_id, existing_id)
+                for source_id, existing_id, example_data in updates
+            }
+            for future in as_completed(futures):
+                source_id, existing_id = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    self.log(f"Failed to update example {existing_id}: {e}", "error")
+                    continue
+                id_mapping[source_id] = existing_id
+                updated_count += 1
+                if verbose:
+                    self.log(f"Updated existing example: {source_id} -> {existing_id}", "info")
+        return updated_count
 
     def _process_example_batch(
         self,
         dest_dataset_id: str,
-        batch: List[Tuple[str, Dict[str, Any], Dict]],
+        batch: List[BatchedExample],
         id_mapping: Dict[str, str]
     ) -> int:
         """
@@ -682,7 +930,7 @@ class DatasetMigrator(BaseMigrator):
         created_count = 0
 
         # Check if any example has attachments
-        has_attachments = any(len(ex[2]) > 0 for ex in batch)
+        has_attachments = any(ex.attachments for ex in batch)
 
         if has_attachments:
             # Use SDK for examples with attachments
@@ -695,7 +943,7 @@ class DatasetMigrator(BaseMigrator):
                 self.log(f"SDK upload failed: {e}", "error")
         else:
             # Use regular bulk endpoint
-            payloads = [ex[1] for ex in batch]
+            payloads = [ex.payload for ex in batch]
             responses = self.dest.post_batch(
                 "/examples/bulk",
                 payloads,
@@ -703,11 +951,11 @@ class DatasetMigrator(BaseMigrator):
             )
 
             # Update ID mappings
-            for i, (original_id, _, _) in enumerate(batch):
-                if i < len(responses) and responses[i] and isinstance(responses[i], dict):
-                    new_id = responses[i].get("id")
+            for ex, response in zip(batch, responses):
+                if response and isinstance(response, dict):
+                    new_id = response.get("id")
                     if new_id:
-                        id_mapping[original_id] = new_id
+                        id_mapping[ex.original_id] = new_id
                         created_count += 1
 
         return created_count
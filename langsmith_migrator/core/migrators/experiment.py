@@ -1,22 +1,114 @@
 """Experiment migration logic."""
 
+from collections import ChainMap, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Dict, List, Any, Optional, Tuple
-import copy
+from functools import lru_cache
+from typing import Deque, Dict, List, Any, Mapping, Optional, Tuple
+import hashlib
+import json
+import threading
 import uuid
 
 from .base import BaseMigrator
+from ..api_client import encode_json_body
 from ...utils.time_shift import shift_experiment_payload, shift_run_payload
 
 
+# Keys of ``extra`` that may hold a list of evaluators.
+_EVALUATOR_LIST_KEYS = ('evaluators', 'comparative_experiment_evaluators', 'dataset_evaluators')
+
+# Evaluator fields that may carry its type under another name, in priority order.
+_EXPLICIT_TYPE_FIELDS = ('evaluator_type', 'eval_type', '__type__')
+
+# Evaluator fields that indicate a code evaluator or an LLM evaluator when
+# the evaluator has no explicit type, checked in order.
+_CODE_EVALUATOR_FIELDS = frozenset({'code', 'function', 'func', 'source_code', 'python_code'})
+_LLM_EVALUATOR_FIELDS = frozenset({'llm', 'model', 'model_name', 'llm_config', 'prompt_template'})
+_TYPE_INDICATOR_RULES = ((_CODE_EVALUATOR_FIELDS, 'Code'), (_LLM_EVALUATOR_FIELDS, 'LLM'))
+
+# Evaluator fields that may carry its feedback key under another name, in priority order.
+_FEEDBACK_KEY_FIELDS = ('key', 'name', 'feedback_name', 'metric_name')
+
+# Flush a /runs/batch upload once its encoded runs reach this many bytes, even
+# below batch_size, so batches of large runs stay well inside the 20 MiB the
+# LangSmith SDK treats as the server's batch ingest limit.
+RUN_BATCH_BYTE_BUDGET = 8 * 1024 * 1024
+
+# Run fields copied verbatim from the source run into the /runs/batch payload.
+_RUN_COPY_FIELDS = ("inputs", "outputs", "start_time", "end_time", "extra", "error")
+
+
+@lru_cache(maxsize=1 << 16)
+def _uuid5_str(namespace: uuid.UUID, name: str) -> str:
+    """Memoized ``str(uuid.uuid5(namespace, name))``.
+
+    Every run re-derives the destination IDs of its trace root and each
+    ancestor in its dotted_order, so the same few source IDs are hashed
+    over and over within a trace.
+    """
+    return str(uuid.uuid5(namespace, name))
+
+
+@dataclass(slots=True)
+class PendingRun:
+    """A /runs/batch payload waiting for upload, keyed to its source run.
+
+    The payload is encoded once here; the same bytes size the batch and are
+    spliced into every /runs/batch body it is sent in, including retries of
+    a split batch.
+    """
+
+    source_run_id: str
+    payload: Dict[str, Any]
+    body: bytes = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.body = encode_json_body(self.payload)
+
+
+def _infer_evaluator_type(evaluator: Dict[str, Any]) -> Optional[str]:
+    """Infer an untyped evaluator's type from its other fields, or None."""
+    explicit = next((evaluator[k] for k in _EXPLICIT_TYPE_FIELDS if evaluator.get(k)), None)
+    if explicit:
+        return explicit
+    for fields, evaluator_type in _TYPE_INDICATOR_RULES:
+        if not fields.isdisjoint(evaluator):
+            return evaluator_type
+    # Fall back to class/constructor hints
+    if evaluator.get('__class__'):
+        class_name = str(evaluator['__class__']).lower()
+        if 'llm' in class_name or 'chat' in class_name or 'model' in class_name:
+            return 'LLM'
+        return 'Code'
+    return None
+
+
 class ExperimentMigrator(BaseMigrator):
     """Handles experiment and run migration."""
 
     _RUN_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "langsmith-data-migration-tool/runs")
 
+    def __init__(self, source_client, dest_client, state, config):
+        super().__init__(source_client, dest_client, state, config)
+        # Destination dataset ID -> {experiment name: experiment ID}, filled on
+        # the first lookup per dataset so later experiments for the same
+        # dataset do not re-page through /sessions.
+        self._existing_by_dataset: Dict[str, Dict[str, str]] = {}
+        # Experiments are created from several threads; one lock per dataset
+        # lets a single thread list it while the others wait for its index.
+        self._existing_locks: Dict[str, threading.Lock] = {}
+        self._existing_locks_guard = threading.Lock()
+
+    def _existing_lock(self, dataset_id: str) -> threading.Lock:
+        """Return the lock guarding ``dataset_id``'s entry in the experiment index."""
+        with self._existing_locks_guard:
+            return self._existing_locks.setdefault(dataset_id, threading.Lock())
+
     def _deterministic_run_id(self, source_run_id: str) -> str:
         """Generate a stable destination run ID for idempotent replay."""
-        return str(uuid.uuid5(self._RUN_NAMESPACE, source_run_id))
+        return _uuid5_str(self._RUN_NAMESPACE, source_run_id)
 
     def _experiment_item_id(self, experiment_id: str) -> str:
         """Return the tracked item id for an experiment."""
@@ -25,7 +117,7 @@ class ExperimentMigrator(BaseMigrator):
     def _regenerate_dotted_order(
         self,
         dotted_order: Optional[str],
-        id_mapping: Dict[str, str],
+        id_mapping: Mapping[str, str],
         new_run_id: str
     ) -> Optional[str]:
         """
@@ -48,29 +140,37 @@ class ExperimentMigrator(BaseMigrator):
         if not dotted_order:
             return None
 
-        parts = dotted_order.split(".")
-        new_parts = []
+        if "." not in dotted_order:
+            # Root run: its only part is its own, so there is nothing to map
+            z_idx = dotted_order.rfind("Z")
+            if z_idx == -1 or z_idx == len(dotted_order) - 1:
+                return dotted_order
+            return dotted_order[:z_idx + 1] + new_run_id
 
-        for i, part in enumerate(parts):
+        new_parts = dotted_order.split(".")
+        last = len(new_parts) - 1
+
+        # Rewrite each part in place; split/join keep the scanning in C
+        for i in range(last + 1):
+            part = new_parts[i]
             # Find the Z separator between timestamp and UUID
             # Format: 20260203T003519695988Zc9ba7a73-985a-4104-aad7-7e3c4fd27a5f
             z_idx = part.rfind("Z")
             if z_idx == -1 or z_idx == len(part) - 1:
                 # No Z found or Z is at the end, keep as-is
-                new_parts.append(part)
                 continue
 
-            timestamp = part[:z_idx + 1]  # Include the Z
-            old_uuid = part[z_idx + 1:]
-
             # For the LAST part, always use the new_run_id
             # This ensures run_id matches the last part of dotted_order (API requirement)
-            if i == len(parts) - 1:
-                new_parts.append(timestamp + new_run_id)
+            if i == last:
+                new_uuid = new_run_id
             else:
                 # Map the UUID to its new value for parent chain
-                new_uuid = id_mapping.get(old_uuid, self._deterministic_run_id(old_uuid))
-                new_parts.append(timestamp + new_uuid)
+                old_uuid = part[z_idx + 1:]
+                new_uuid = id_mapping.get(old_uuid)
+                if new_uuid is None:
+                    new_uuid = self._deterministic_run_id(old_uuid)
+            new_parts[i] = part[:z_idx + 1] + new_uuid  # Keep the timestamp and its Z
 
         return ".".join(new_parts)
 
@@ -91,11 +191,23 @@ class ExperimentMigrator(BaseMigrator):
         if not extra:
             return extra
 
-        # Make a deep copy to avoid modifying the original
-        extra_copy = copy.deepcopy(extra)
+        verbose = self.config.migration.verbose
 
         # Check common locations where evaluators might be stored
-        evaluator_keys = ['evaluators', 'comparative_experiment_evaluators', 'dataset_evaluators']
+        evaluator_keys = _EVALUATOR_LIST_KEYS
+        if not any(isinstance(extra.get(key), list) for key in evaluator_keys):
+            # Nothing below would change; hand back the source blob as-is
+            return extra
+
+        # Copy only what is modified below - the evaluator lists and their
+        # top-level fields - and share the rest of ``extra`` with the source.
+        extra_copy = dict(extra)
+        for key in evaluator_keys:
+            if isinstance(extra_copy.get(key), list):
+                extra_copy[key] = [
+                    dict(evaluator) if isinstance(evaluator, dict) else evaluator
+                    for evaluator in extra_copy[key]
+                ]
 
         total_evaluators_found = 0
 
@@ -111,82 +223,57 @@ class ExperimentMigrator(BaseMigrator):
                         continue
 
                     # Log full evaluator structure for debugging
-                    if self.config.migration.verbose:
-                        import json
+                    if verbose:
                         self.log(f"  Raw evaluator data: {json.dumps(evaluator, indent=2, default=str)}", "info")
 
                     # Ensure 'type' field exists
                     if 'type' not in evaluator or not evaluator['type']:
                         # Try to infer type from other fields
-                        inferred_type = None
-
-                        # Check various field names
-                        if 'evaluator_type' in evaluator and evaluator['evaluator_type']:
-                            inferred_type = evaluator['evaluator_type']
-                        elif 'eval_type' in evaluator and evaluator['eval_type']:
-                            inferred_type = evaluator['eval_type']
-                        elif '__type__' in evaluator and evaluator['__type__']:
-                            inferred_type = evaluator['__type__']
-                        # Check for code/function indicators
-                        elif any(k in evaluator for k in ['code', 'function', 'func', 'source_code', 'python_code']):
-                            inferred_type = 'Code'
-                        # Check for LLM indicators
-                        elif any(k in evaluator for k in ['llm', 'model', 'model_name', 'llm_config', 'prompt_template']):
-                            inferred_type = 'LLM'
-                        # Check class/constructor hints
-                        elif evaluator.get('__class__'):
-                            class_name = str(evaluator['__class__']).lower()
-                            if 'llm' in class_name or 'chat' in class_name or 'model' in class_name:
-                                inferred_type = 'LLM'
-                            else:
-                                inferred_type = 'Code'
+                        inferred_type = _infer_evaluator_type(evaluator)
 
                         if inferred_type:
                             evaluator['type'] = inferred_type
-                            if self.config.migration.verbose:
+                            if verbose:
                                 self.log(f"  Inferred type '{inferred_type}' from fields", "info")
                         else:
                             # Default to Code if we can't determine
                             evaluator['type'] = 'Code'
-                            self.log(f"Warning: Evaluator missing type, defaulting to 'Code': {evaluator.get('name', 'unknown')}", "warning")
-                            import json
-                            self.log(f"  Full evaluator data: {json.dumps(evaluator, indent=2, default=str)}", "warning")
+                            if verbose:
+                                self.log(f"Warning: Evaluator missing type, defaulting to 'Code': {evaluator.get('name', 'unknown')}", "warning")
+                                self.log(f"  Full evaluator data: {json.dumps(evaluator, indent=2, default=str)}", "warning")
 
                     # Ensure 'feedback_key' field exists
                     if 'feedback_key' not in evaluator or not evaluator['feedback_key']:
                         # Try to infer from other fields
-                        inferred_key = None
-
-                        # Try various field names
-                        if 'key' in evaluator and evaluator['key']:
-                            inferred_key = evaluator['key']
-                        elif 'name' in evaluator and evaluator['name']:
-                            inferred_key = evaluator['name']
-                        elif 'feedback_name' in evaluator and evaluator['feedback_name']:
-                            inferred_key = evaluator['feedback_name']
-                        elif 'metric_name' in evaluator and evaluator['metric_name']:
-                            inferred_key = evaluator['metric_name']
-                        elif 'id' in evaluator and evaluator['id']:
+                        inferred_key = next(
+                            (evaluator[k] for k in _FEEDBACK_KEY_FIELDS if evaluator.get(k)), None
+                        )
+                        if inferred_key is None and isinstance(evaluator.get('id'), str):
                             # Use ID as last resort if it's a string
-                            if isinstance(evaluator['id'], str):
-                                inferred_key = evaluator['id']
+                            inferred_key = evaluator['id']
 
                         if inferred_key:
                             evaluator['feedback_key'] = inferred_key
-                            if self.config.migration.verbose:
+                            if verbose:
                                 self.log(f"  Inferred feedback_key '{inferred_key}' from fields", "info")
                         else:
                             # Generate a default feedback key using a more stable identifier
                             if 'name' in evaluator:
                                 evaluator['feedback_key'] = f"{evaluator['name']}_key"
                             else:
-                                evaluator['feedback_key'] = f"evaluator_{hash(str(evaluator))}"
-                            self.log(f"Warning: Evaluator missing feedback_key, generated: {evaluator['feedback_key']}", "warning")
-                            import json
-                            self.log(f"  Full evaluator data: {json.dumps(evaluator, indent=2, default=str)}", "warning")
-
-                    # Always log evaluator details (not just in verbose mode) so user can see they're being migrated
-                    self.log(f"  ✓ Evaluator: {evaluator.get('name', 'unnamed')} (type={evaluator.get('type')}, feedback_key={evaluator.get('feedback_key')})", "success")
+                                # Content hash, not hash(): str hashes are salted per
+                                # process, so re-runs would mint a different key.
+                                digest = hashlib.blake2b(
+                                    json.dumps(evaluator, sort_keys=True, default=str).encode("utf-8"),
+                                    digest_size=8,
+                                ).hexdigest()
+                                evaluator['feedback_key'] = f"evaluator_{digest}"
+                            if verbose:
+                                self.log(f"Warning: Evaluator missing feedback_key, generated: {evaluator['feedback_key']}", "warning")
+                                self.log(f"  Full evaluator data: {json.dumps(evaluator, indent=2, default=str)}", "warning")
+
+                    if verbose:
+                        self.log(f"  ✓ Evaluator: {evaluator.get('name', 'unnamed')} (type={evaluator.get('type')}, feedback_key={evaluator.get('feedback_key')})", "success")
 
         if total_evaluators_found > 0:
             self.log(f"Total evaluators processed: {total_evaluators_found}", "success")
@@ -199,34 +286,49 @@ class ExperimentMigrator(BaseMigrator):
 
         Fetches full experiment details including evaluators in the 'extra' field.
         """
-        experiments = []
-        for experiment in self.source.get_paginated(
-            "/sessions",
-            params={"reference_dataset": dataset_id}
-        ):
-            if isinstance(experiment, dict):
-                # Get the full experiment details to ensure we have all metadata
-                # including evaluators in the 'extra' field
-                exp_id = experiment.get('id')
-                if exp_id:
-                    try:
-                        full_experiment = self.source.get(f"/sessions/{exp_id}")
-                        # Log if we find evaluators
-                        if full_experiment.get('extra'):
-                            has_evaluators = any(
-                                key in full_experiment['extra']
-                                for key in ['evaluators', 'comparative_experiment_evaluators', 'dataset_evaluators']
-                            )
-                            if has_evaluators:
-                                self.log(f"Found evaluators in experiment '{full_experiment.get('name', exp_id)}'", "info")
-                        experiments.append(full_experiment)
-                    except Exception as e:
-                        self.log(f"Failed to fetch full details for experiment {exp_id}: {e}", "warning")
-                        # Fall back to the summary data if full fetch fails
-                        experiments.append(experiment)
-                else:
-                    experiments.append(experiment)
-        return experiments
+        summaries = [
+            experiment
+            for experiment in self.source.get_paginated(
+                "/sessions",
+                params={"reference_dataset": dataset_id}
+            )
+            if isinstance(experiment, dict)
+        ]
+        if not summaries:
+            return []
+
+        # One detail GET per experiment; issue them concurrently rather than
+        # paying each round-trip in turn. map() keeps the listing order.
+        workers = max(1, min(self.config.migration.concurrent_workers, len(summaries)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._fetch_full_experiment, summaries))
+
+    def _fetch_full_experiment(self, experiment: Dict[str, Any]) -> Dict[str, Any]:
+        """Return full details for a listed experiment, or the summary on failure."""
+        # Get the full experiment details to ensure we have all metadata
+        # including evaluators in the 'extra' field
+        exp_id = experiment.get('id')
+        if not exp_id:
+            return experiment
+        # The listing's 'extra' may be partial, so it is only trusted when it
+        # already carries the evaluator lists _ensure_evaluator_types reads.
+        # Anything else (null, or metadata without evaluators) gets the full
+        # record.
+        extra = experiment.get("extra")
+        if isinstance(extra, dict) and any(key in extra for key in _EVALUATOR_LIST_KEYS):
+            return experiment
+        try:
+            full_experiment = self.source.get(f"/sessions/{exp_id}")
+            # Log if we find evaluators
+            if full_experiment.get('extra'):
+                has_evaluators = any(key in full_experiment['extra'] for key in _EVALUATOR_LIST_KEYS)
+                if has_evaluators:
+                    self.log(f"Found evaluators in experiment '{full_experiment.get('name', exp_id)}'", "info")
+            return full_experiment
+        except Exception as e:
+            self.log(f"Failed to fetch full details for experiment {exp_id}: {e}", "warning")
+            # Fall back to the summary data if full fetch fails
+            return experiment
 
     def find_existing_experiment(self, name: str, dataset_id: str) -> Optional[str]:
         """
@@ -239,25 +341,27 @@ class ExperimentMigrator(BaseMigrator):
         Returns:
             The experiment ID if found, None otherwise
         """
-        try:
-            # List experiments for the dataset
-            experiments = []
-            for experiment in self.dest.get_paginated(
-                "/sessions",
-                params={"reference_dataset": dataset_id}
-            ):
-                if isinstance(experiment, dict):
-                    experiments.append(experiment)
-
-            # Find by name
-            for exp in experiments:
-                if exp.get("name") == name:
-                    return exp.get("id")
+        existing = self._existing_by_dataset.get(dataset_id)
+        if existing is None:
+            with self._existing_lock(dataset_id):
+                # Another thread may have listed the dataset while we waited
+                existing = self._existing_by_dataset.get(dataset_id)
+                if existing is None:
+                    try:
+                        existing = {}
+                        for experiment in self.dest.get_paginated(
+                            "/sessions",
+                            params={"reference_dataset": dataset_id}
+                        ):
+                            if isinstance(experiment, dict) and experiment.get("name") is not None:
+                                # Keep the first match, as the old linear scan did
+                                existing.setdefault(experiment["name"], experiment.get("id"))
+                    except Exception as e:
+                        self.log(f"Failed to check for existing experiment: {e}", "warning")
+                        return None
+                    self._existing_by_dataset[dataset_id] = existing
 
-            return None
-        except Exception as e:
-            self.log(f"Failed to check for existing experiment: {e}", "warning")
-            return None
+        return existing.get(name)
 
     def update_experiment(self, experiment_id: str, experiment: Dict[str, Any]) -> None:
         """Update existing experiment in destination."""
@@ -268,15 +372,15 @@ class ExperimentMigrator(BaseMigrator):
         # Ensure evaluators in the extra field are properly typed
         extra = self._ensure_evaluator_types(experiment.get("extra"))
 
-        payload = {
-            "name": experiment["name"],
-            "description": experiment.get("description"),
-            "extra": extra,
-            "trace_tier": experiment.get("trace_tier")
-        }
-
-        # Remove None values
-        payload = {k: v for k, v in payload.items() if v is not None}
+        # Leave out None values
+        payload = {"name": experiment["name"]}
+        for key, value in (
+            ("description", experiment.get("description")),
+            ("extra", extra),
+            ("trace_tier", experiment.get("trace_tier")),
+        ):
+            if value is not None:
+                payload[key] = value
 
         self.dest.patch(f"/sessions/{experiment_id}", payload)
         self.log(f"Updated experiment: {experiment['name']} ({experiment_id})", "success")
@@ -332,6 +436,10 @@ class ExperimentMigrator(BaseMigrator):
             from ..api_client import APIError
             raise APIError(f"Invalid response creating experiment: missing 'id' field. Response: {response}")
 
+        with self._existing_lock(new_dataset_id):
+            existing = self._existing_by_dataset.get(new_dataset_id)
+            if existing is not None:
+                existing.setdefault(payload["name"], response["id"])
         return response["id"]
 
     def migrate_runs_streaming(
@@ -368,6 +476,20 @@ class ExperimentMigrator(BaseMigrator):
         experiment_mapping = id_mappings.get("experiments", {})
         example_mapping = id_mappings.get("examples", {})
 
+        # Runs are queried one experiment at a time, so a repeated ID would
+        # re-page the same runs and an experiment with no destination session
+        # would only have its runs paged through and skipped.
+        unique_ids = list(dict.fromkeys(experiment_ids))
+        experiment_ids = [exp_id for exp_id in unique_ids if exp_id in experiment_mapping]
+        if len(experiment_ids) < len(unique_ids):
+            self.log(
+                f"Skipping runs for {len(unique_ids) - len(experiment_ids)} experiment(s) "
+                "with no destination mapping",
+                "warning",
+            )
+        if not experiment_ids:
+            return 0, run_id_mapping, 0
+
         self.log(f"Starting run migration for {len(experiment_ids)} experiment(s)", "info")
         self.log(f"Experiment ID mapping: {experiment_mapping}", "info")
 
@@ -375,265 +497,340 @@ class ExperimentMigrator(BaseMigrator):
         total_skipped = 0
         total_failed = 0
 
-        # Query runs for EACH experiment separately
-        # The LangSmith /runs/query API only processes the first session ID when given a list
-        for exp_idx, experiment_id in enumerate(experiment_ids, 1):
-            experiment_delta = (time_deltas or {}).get(experiment_id)
-            experiment_item_id = self._experiment_item_id(experiment_id)
-            experiment_item = self.state.get_item(experiment_item_id) if self.state else None
-            start_cursor = experiment_item.metadata.get("run_cursor") if experiment_item else None
-            pending_run_mapping: Dict[str, str] = {}
-            batch: List[Dict[str, Any]] = []
-            experiment_runs_created = 0
-            experiment_failed_runs = 0
-
-            def flush_batch() -> int:
-                nonlocal total_runs, total_failed
-                nonlocal experiment_runs_created, experiment_failed_runs
-
-                if not batch:
-                    return 0
-
-                created_mapping, failed_runs = self._create_runs_batch(batch)
-                total_runs += len(created_mapping)
-                total_failed += len(failed_runs)
-                experiment_runs_created += len(created_mapping)
-                experiment_failed_runs += len(failed_runs)
-
-                if created_mapping:
-                    run_id_mapping.update(created_mapping)
-                    if self.state:
-                        for old_id, new_id in created_mapping.items():
-                            self.state.set_mapped_id("run", old_id, new_id)
-                        self.persist_state()
-                    self.log(
-                        f"Created batch of {len(created_mapping)} runs (total: {total_runs})",
-                        "info",
-                    )
-
-                if failed_runs:
-                    failed_ids = {entry["source_run_id"] for entry in failed_runs}
-                    for failed_id in failed_ids:
-                        pending_run_mapping.pop(failed_id, None)
-                    self.log(f"Failed to create {len(failed_runs)} run(s) in batch", "error")
-                    if experiment_item:
-                        issue = self.record_issue(
-                            "transient",
-                            "run_batch_failed",
-                            f"Run batch creation failed for experiment {experiment_id}",
-                            item_id=experiment_item_id,
-                            next_action="Re-run `langsmith-migrator resume` to replay the failed runs.",
-                            evidence={"failed_runs": failed_runs[:10], "failed_count": len(failed_runs)},
+        # One extra worker keeps the next /runs/query page in flight while the
+        # current page's batches upload.
+        upload_workers = max(1, self.config.migration.concurrent_workers)
+        batch_size = self.config.migration.batch_size
+        # Bound once; these are called several times for every run
+        deterministic_run_id = self._deterministic_run_id
+        regenerate_dotted_order = self._regenerate_dotted_order
+        with ThreadPoolExecutor(max_workers=upload_workers + 1) as executor:
+            # Query runs for EACH experiment separately
+            # The LangSmith /runs/query API only processes the first session ID when given a list
+            for exp_idx, experiment_id in enumerate(experiment_ids, 1):
+                experiment_delta = (time_deltas or {}).get(experiment_id)
+                experiment_item_id = self._experiment_item_id(experiment_id)
+                experiment_item = self.state.get_item(experiment_item_id) if self.state else None
+                start_cursor = experiment_item.metadata.get("run_cursor") if experiment_item else None
+                pending_run_mapping: Dict[str, str] = {}
+                # Live view over both mappings (pending entries win), instead of
+                # merging them into a new dict for every run.
+                combined_mapping = ChainMap(pending_run_mapping, run_id_mapping)
+                batch: List[PendingRun] = []
+                batch_bytes = 0
+                # dotted_order depth of the first and last run in ``batch``
+                batch_min_depth = batch_max_depth = 0
+                experiment_runs_created = 0
+                experiment_failed_runs = 0
+
+                # (shallowest run depth, upload) for each batch still in flight
+                in_flight: Deque[
+                    Tuple[int, "Future[Tuple[Dict[str, str], List[Dict[str, str]]]]"]
+                ] = deque()
+
+                def settle(future: "Future[Tuple[Dict[str, str], List[Dict[str, str]]]]") -> None:
+                    record_results(*future.result())
+
+                def record_results(
+                    created_mapping: Dict[str, str], failed_runs: List[Dict[str, str]]
+                ) -> None:
+                    nonlocal total_runs, total_failed
+                    nonlocal experiment_runs_created, experiment_failed_runs
+
+                    total_runs += len(created_mapping)
+                    total_failed += len(failed_runs)
+                    experiment_runs_created += len(created_mapping)
+                    experiment_failed_runs += len(failed_runs)
+
+                    if created_mapping:
+                        run_id_mapping.update(created_mapping)
+                        if self.state:
+                            for old_id, new_id in created_mapping.items():
+                                self.state.set_mapped_id("run", old_id, new_id)
+                            self.persist_state()
+                        self.log(
+                            f"Created batch of {len(created_mapping)} runs (total: {total_runs})",
+                            "info",
                         )
-                        if issue:
-                            self.queue_remediation(
-                                issue_id=issue.id,
-                                next_action=issue.next_action or "Resume experiment runs.",
+
+                    if failed_runs:
+                        failed_ids = {entry["source_run_id"] for entry in failed_runs}
+                        for failed_id in failed_ids:
+                            pending_run_mapping.pop(failed_id, None)
+                        self.log(f"Failed to create {len(failed_runs)} run(s) in batch", "error")
+                        if experiment_item:
+                            issue = self.record_issue(
+                                "transient",
+                                "run_batch_failed",
+                                f"Run batch creation failed for experiment {experiment_id}",
                                 item_id=experiment_item_id,
-                                command="langsmith-migrator resume",
+                                next_action="Re-run `langsmith-migrator resume` to replay the failed runs.",
+                                evidence={"failed_runs": failed_runs[:10], "failed_count": len(failed_runs)},
                             )
+                            if issue:
+                                self.queue_remediation(
+                                    issue_id=issue.id,
+                                    next_action=issue.next_action or "Resume experiment runs.",
+                                    item_id=experiment_item_id,
+                                    command="langsmith-migrator resume",
+                                )
+
+                    for created_id in created_mapping:
+                        pending_run_mapping.pop(created_id, None)
+
+                def flush_batch() -> None:
+                    nonlocal batch, batch_bytes
+                    # Upload in the background; results are folded into the
+                    # mappings and state here on the calling thread by settle().
+                    # The worker owns the handed-off list, so start a fresh one
+                    # rather than copying and clearing a reused buffer.
+                    if not batch:
+                        return
+                    # Runs are depth-sorted, so only batches of the same depth
+                    # may upload side by side. Anything shallower still in
+                    # flight may hold a parent of this batch and must land first.
+                    while in_flight and in_flight[0][0] < batch_max_depth:
+                        settle(in_flight.popleft()[1])
+                    # Make room before submitting, so a full upload_workers
+                    # uploads keep running while the next batch is built.
+                    while len(in_flight) >= upload_workers:
+                        settle(in_flight.popleft()[1])
+                    in_flight.append(
+                        (batch_min_depth, executor.submit(self._create_runs_batch, batch))
+                    )
+                    batch = []
+                    batch_bytes = 0
+
+                def drain_uploads() -> None:
+                    while in_flight:
+                        settle(in_flight.popleft()[1])
+
+                self.log(f"Fetching runs for experiment {exp_idx}/{len(experiment_ids)}: {experiment_id}", "info")
+
+                payload = {
+                    "session": [experiment_id],  # Single ID in a list (API requires list format)
+                    "skip_pagination": False
+                }
+                if start_cursor:
+                    payload["cursor"] = start_cursor
+                    self.log(f"Resuming runs for experiment {experiment_id} from cursor {start_cursor}", "info")
+                if experiment_item:
+                    self.checkpoint_item(
+                        experiment_item_id,
+                        stage="migrate_runs",
+                        metadata={"run_cursor": start_cursor},
+                    )
 
-                for created_id in created_mapping:
-                    pending_run_mapping.pop(created_id, None)
-                batch.clear()
-                return len(failed_runs)
-
-            self.log(f"Fetching runs for experiment {exp_idx}/{len(experiment_ids)}: {experiment_id}", "info")
-
-            payload = {
-                "session": [experiment_id],  # Single ID in a list (API requires list format)
-                "skip_pagination": False
-            }
-            if start_cursor:
-                payload["cursor"] = start_cursor
-                self.log(f"Resuming runs for experiment {experiment_id} from cursor {start_cursor}", "info")
-            if experiment_item:
-                self.checkpoint_item(
-                    experiment_item_id,
-                    stage="migrate_runs",
-                    metadata={"run_cursor": start_cursor},
-                )
-
-            page_num = 0
-            while True:
-                page_num += 1
-                try:
-                    response = self.source.post("/runs/query", payload)
-                except Exception as e:
-                    # Do not swallow this. Breaking out leaves the failure counter at
-                    # zero, so the caller concludes the run stage succeeded and moves
-                    # on to feedback - producing an empty experiment on the destination
-                    # that gets reported as a feedback problem. Raise so the caller
-                    # marks the item failed with the real error. The per-page
-                    # run_cursor checkpoint above means resume picks up where we
-                    # stopped rather than re-walking the experiment.
-                    self.log(f"Error querying runs for experiment {experiment_id}: {e}", "error")
-                    if experiment_item:
-                        issue = self.record_issue(
-                            "transient",
-                            "run_query_failed",
-                            f"Could not query source runs for experiment {experiment_id}",
-                            item_id=experiment_item_id,
-                            next_action="Re-run `langsmith-migrator resume` to continue from the last cursor.",
-                            evidence={
-                                "error": str(e),
-                                "page": page_num,
-                                "cursor": payload.get("cursor"),
-                                "runs_migrated_before_failure": experiment_runs_created,
-                            },
-                        )
-                        if issue:
-                            self.queue_remediation(
-                                issue_id=issue.id,
-                                next_action=issue.next_action or "Retry the source run query.",
+                page_num = 0
+                page_future = executor.submit(self.source.post, "/runs/query", dict(payload))
+                while True:
+                    page_num += 1
+                    try:
+                        response = page_future.result()
+                    except Exception as e:
+                        # Do not swallow this. Breaking out leaves the failure counter at
+                        # zero, so the caller concludes the run stage succeeded and moves
+                        # on to feedback - producing an empty experiment on the destination
+                        # that gets reported as a feedback problem. Raise so the caller
+                        # marks the item failed with the real error. The per-page
+                        # run_cursor checkpoint above means resume picks up where we
+                        # stopped rather than re-walking the experiment.
+                        self.log(f"Error querying runs for experiment {experiment_id}: {e}", "error")
+                        if experiment_item:
+                            issue = self.record_issue(
+                                "transient",
+                                "run_query_failed",
+                                f"Could not query source runs for experiment {experiment_id}",
                                 item_id=experiment_item_id,
-                                command="langsmith-migrator resume",
+                                next_action="Re-run `langsmith-migrator resume` to continue from the last cursor.",
+                                evidence={
+                                    "error": str(e),
+                                    "page": page_num,
+                                    "cursor": payload.get("cursor"),
+                                    "runs_migrated_before_failure": experiment_runs_created,
+                                },
                             )
-                    raise
-
-                runs = response.get("runs", [])
-
-                # Sort runs by dotted_order to ensure parents are processed before children
-                # dotted_order format: {timestamp}Z{uuid}.{timestamp}Z{uuid}...
-                # Shorter dotted_order = closer to root, so sorting alphabetically works
-                # This prevents "dotted_order must contain a single part for root runs" errors
-                # when a child run would otherwise be processed before its parent
-                runs.sort(key=lambda r: r.get("dotted_order", ""))
-
-                self.log(f"Experiment {experiment_id} page {page_num}: Retrieved {len(runs)} runs", "info")
-
-                if not runs:
-                    if page_num == 1:
-                        self.log(f"No runs found for experiment {experiment_id}", "info")
-                    break
-
-                failures_before_page = experiment_failed_runs
-                current_cursor = payload.get("cursor")
-
-                for run in runs:
-                    source_session_id = run.get("session_id")
-                    source_run_id = run.get("id")
-                    if not source_run_id:
-                        continue
-
-                    # Map IDs
-                    if source_session_id not in experiment_mapping:
-                        self.log(
-                            f"Skipping run {source_run_id} - session_id {source_session_id} not in experiment mapping",
-                            "warning"
+                            if issue:
+                                self.queue_remediation(
+                                    issue_id=issue.id,
+                                    next_action=issue.next_action or "Retry the source run query.",
+                                    item_id=experiment_item_id,
+                                    command="langsmith-migrator resume",
+                                )
+                        raise
+
+                    runs = response.get("runs", [])
+
+                    # Sort runs by dotted_order depth to ensure parents are processed before children
+                    # dotted_order format: {timestamp}Z{uuid}.{timestamp}Z{uuid}...
+                    # A child always has one more '.'-separated part than its parent, so
+                    # comparing part counts is enough and avoids comparing long strings.
+                    # This prevents "dotted_order must contain a single part for root runs" errors
+                    # when a child run would otherwise be processed before its parent
+                    runs.sort(key=lambda r: (r.get("dotted_order") or "").count("."))
+
+                    self.log(f"Experiment {experiment_id} page {page_num}: Retrieved {len(runs)} runs", "info")
+
+                    if not runs:
+                        if page_num == 1:
+                            self.log(f"No runs found for experiment {experiment_id}", "info")
+                        break
+
+                    failures_before_page = experiment_failed_runs
+                    current_cursor = payload.get("cursor")
+
+                    # Fetch the next page while this one is transformed and uploaded.
+                    # If this page ends up with failures the prefetched page is
+                    # simply discarded; the checkpoint below still points here.
+                    cursors = response.get("cursors")
+                    next_cursor = cursors.get("next") if cursors else None
+                    if next_cursor:
+                        page_future = executor.submit(
+                            self.source.post, "/runs/query", {**payload, "cursor": next_cursor}
                         )
-                        total_skipped += 1
-                        continue
-
-                    if source_run_id in run_id_mapping:
-                        total_skipped += 1
-                        continue
-
-                    dest_session_id = experiment_mapping[source_session_id]
 
-                    # Map parent_run_id if present and already migrated
-                    parent_run_id = run.get("parent_run_id")
-                    mapped_parent_id = (
-                        self._deterministic_run_id(parent_run_id) if parent_run_id else None
-                    )
+                    for run in runs:
+                        source_session_id = run.get("session_id")
+                        source_run_id = run.get("id")
+                        if not source_run_id:
+                            continue
 
-                    # Map reference_example_id if present
-                    source_example_id = run.get("reference_example_id")
-                    mapped_example_id = None
-                    if source_example_id:
-                        mapped_example_id = example_mapping.get(source_example_id)
-                        if not mapped_example_id:
+                        # Map IDs
+                        dest_session_id = experiment_mapping.get(source_session_id)
+                        if dest_session_id is None:
                             self.log(
-                                f"Warning: run references unmapped example {source_example_id}, dropping example link",
-                                "warning",
+                                f"Skipping run {source_run_id} - session_id {source_session_id} not in experiment mapping",
+                                "warning"
                             )
+                            total_skipped += 1
+                            continue
 
-                    # Deterministic IDs make interrupted batches safe to replay.
-                    new_run_id = self._deterministic_run_id(source_run_id)
-                    source_trace_id = run.get("trace_id")
-                    new_trace_id = (
-                        self._deterministic_run_id(source_trace_id)
-                        if source_trace_id
-                        else new_run_id
-                    )
-                    pending_run_mapping[source_run_id] = new_run_id
+                        if source_run_id in run_id_mapping:
+                            total_skipped += 1
+                            continue
 
-                    combined_mapping = {**run_id_mapping, **pending_run_mapping}
+                        # Map parent_run_id if present and already migrated
+                        parent_run_id = run.get("parent_run_id")
+                        mapped_parent_id = (
+                            deterministic_run_id(parent_run_id) if parent_run_id else None
+                        )
 
-                    # Regenerate dotted_order with new IDs
-                    new_dotted_order = self._regenerate_dotted_order(
-                        run.get("dotted_order"),
-                        combined_mapping,
-                        new_run_id
-                    )
+                        # Map reference_example_id if present
+                        source_example_id = run.get("reference_example_id")
+                        mapped_example_id = None
+                        if source_example_id:
+                            mapped_example_id = example_mapping.get(source_example_id)
+                            if not mapped_example_id:
+                                self.log(
+                                    f"Warning: run references unmapped example {source_example_id}, dropping example link",
+                                    "warning",
+                                )
+
+                        # Deterministic IDs make interrupted batches safe to replay.
+                        new_run_id = deterministic_run_id(source_run_id)
+                        source_trace_id = run.get("trace_id")
+                        new_trace_id = (
+                            deterministic_run_id(source_trace_id)
+                            if source_trace_id
+                            else new_run_id
+                        )
+                        pending_run_mapping[source_run_id] = new_run_id
 
-                    migrated_run = {
-                        "id": new_run_id,
-                        "name": run["name"],
-                        "inputs": run.get("inputs"),
-                        "outputs": run.get("outputs"),
-                        "run_type": run["run_type"],
-                        "start_time": run.get("start_time"),
-                        "end_time": run.get("end_time"),
-                        "extra": run.get("extra"),
-                        "error": run.get("error"),
-                        "serialized": run.get("serialized", {}),
-                        "parent_run_id": mapped_parent_id,
-                        "events": run.get("events", []),
-                        "tags": run.get("tags", []),
-                        "trace_id": new_trace_id,
-                        "dotted_order": new_dotted_order,
-                        "session_id": dest_session_id,
-                        "reference_example_id": mapped_example_id,
-                        "_source_run_id": source_run_id,
-                    }
-
-                    if experiment_delta is not None:
-                        migrated_run = shift_run_payload(migrated_run, experiment_delta)
-
-                    # Remove None values to avoid API validation errors (422)
-                    migrated_run = {k: v for k, v in migrated_run.items() if v is not None}
-
-                    batch.append(migrated_run)
-
-                    if len(batch) >= self.config.migration.batch_size:
-                        flush_batch()
-
-                flush_batch()
-                page_had_failures = experiment_failed_runs > failures_before_page
-
-                cursors = response.get("cursors")
-                next_cursor = cursors.get("next") if cursors else None
-                checkpoint_cursor = current_cursor if page_had_failures else next_cursor
+                        # Regenerate dotted_order with new IDs
+                        new_dotted_order = regenerate_dotted_order(
+                            run.get("dotted_order"),
+                            combined_mapping,
+                            new_run_id
+                        )
 
-                if experiment_item:
-                    self.checkpoint_item(
-                        experiment_item_id,
-                        stage="migrate_runs",
-                        metadata={
-                            "run_cursor": checkpoint_cursor,
-                            "run_failures": experiment_failed_runs,
-                            "runs_migrated": experiment_runs_created,
-                        },
-                    )
+                        migrated_run = {
+                            "id": new_run_id,
+                            "trace_id": new_trace_id,
+                            "session_id": dest_session_id,
+                        }
+                        # Leave None values out to avoid API validation errors (422)
+                        for field in _RUN_COPY_FIELDS:
+                            value = run.get(field)
+                            if value is not None:
+                                migrated_run[field] = value
+                        for field, value in (
+                            ("name", run["name"]),
+                            ("run_type", run["run_type"]),
+                            ("serialized", run.get("serialized", {})),
+                            ("events", run.get("events", [])),
+                            ("tags", run.get("tags", [])),
+                            ("parent_run_id", mapped_parent_id),
+                            ("dotted_order", new_dotted_order),
+                            ("reference_example_id", mapped_example_id),
+                        ):
+                            if value is not None:
+                                migrated_run[field] = value
+
+                        if experiment_delta is not None:
+                            # Unparseable timestamps shift to None
+                            migrated_run = {
+                                k: v
+                                for k, v in shift_run_payload(migrated_run, experiment_delta).items()
+                                if v is not None
+                            }
+
+                        depth = (run.get("dotted_order") or "").count(".")
+                        if not batch:
+                            batch_min_depth = depth
+                        batch_max_depth = depth
+                        try:
+                            pending_run = PendingRun(source_run_id, migrated_run)
+                        except (TypeError, ValueError) as e:
+                            # Unencodable payload (e.g. NaN or a non-JSON value);
+                            # fail this run alone, as a rejected upload would.
+                            self.log(f"Could not encode run {source_run_id}: {e}", "error")
+                            record_results({}, [{"source_run_id": source_run_id, "error": str(e)}])
+                            continue
+                        batch.append(pending_run)
+                        batch_bytes += len(pending_run.body)
+
+                        if (
+                            len(batch) >= batch_size
+                            or batch_bytes >= RUN_BATCH_BYTE_BUDGET
+                        ):
+                            flush_batch()
+
+                    flush_batch()
+                    # Every upload for this page must land before its cursor is
+                    # checkpointed, or resume could skip runs that never made it.
+                    drain_uploads()
+                    page_had_failures = experiment_failed_runs > failures_before_page
+
+                    checkpoint_cursor = current_cursor if page_had_failures else next_cursor
+
+                    if experiment_item:
+                        self.checkpoint_item(
+                            experiment_item_id,
+                            stage="migrate_runs",
+                            metadata={
+                                "run_cursor": checkpoint_cursor,
+                                "run_failures": experiment_failed_runs,
+                                "runs_migrated": experiment_runs_created,
+                            },
+                        )
 
-                if page_had_failures or not next_cursor:
-                    break
+                    if page_had_failures or not next_cursor:
+                        break
 
-                payload["cursor"] = next_cursor
-                self.log(f"Fetching next page with cursor: {next_cursor}", "info")
+                    payload["cursor"] = next_cursor
+                    self.log(f"Fetching next page with cursor: {next_cursor}", "info")
 
         self.log(f"Run migration complete: {total_runs} migrated, {total_skipped} skipped", "success")
         return total_runs, run_id_mapping, total_failed
 
     def _create_runs_batch(
-        self, runs: List[Dict[str, Any]]
+        self, runs: List[PendingRun]
     ) -> tuple[Dict[str, str], List[Dict[str, str]]]:
         """
         Create a batch of runs.
 
         Args:
-            runs: List of run dictionaries to create
+            runs: Run payloads to create, with their source run IDs
 
         Returns:
             Tuple of (created_mapping, failed_runs).
@@ -644,30 +841,22 @@ class ExperimentMigrator(BaseMigrator):
         created_mapping: Dict[str, str] = {}
         failed_runs: List[Dict[str, str]] = []
 
-        def strip_internal_fields(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-            stripped = []
-            for run in batch:
-                stripped.append({k: v for k, v in run.items() if not k.startswith("_")})
-            return stripped
-
-        def post_recursive(batch: List[Dict[str, Any]]) -> None:
-            payload = {"post": strip_internal_fields(batch)}
+        def post_recursive(batch: List[PendingRun]) -> None:
+            body = b'{"post":[' + b",".join(run.body for run in batch) + b"]}"
             self.log(f"Creating batch of {len(batch)} runs via /runs/batch", "info")
             try:
-                response = self.dest.post("/runs/batch", payload)
+                response = self.dest.post("/runs/batch", body)
                 if isinstance(response, dict) and response.get("errors"):
                     raise ValueError(f"Batch creation had {len(response['errors'])} error(s)")
 
                 for run in batch:
-                    source_run_id = run.get("_source_run_id")
-                    if source_run_id:
-                        created_mapping[source_run_id] = run["id"]
+                    created_mapping[run.source_run_id] = run.payload["id"]
             except Exception as e:
                 if len(batch) == 1:
-                    source_run_id = batch[0].get("_source_run_id", "unknown")
+                    source_run_id = batch[0].source_run_id
                     error_text = str(e)
                     if "409" in error_text or "Conflict" in error_text:
-                        created_mapping[source_run_id] = batch[0]["id"]
+                        created_mapping[source_run_id] = batch[0].payload["id"]
                         self.log(
                             f"Run {source_run_id} already exists with deterministic ID; treating as replay success",
                             "warning",
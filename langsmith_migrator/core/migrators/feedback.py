@@ -2,7 +2,9 @@
 
 import hashlib
 import json
-from typing import Dict, List, Any, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, List, Any, Optional, Tuple
 
 from .base import BaseMigrator
 
@@ -27,54 +29,88 @@ class FeedbackMigrator(BaseMigrator):
             "correction": feedback.get("correction"),
         }
         serialized = json.dumps(payload, sort_keys=True, default=str)
-        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        return hashlib.sha256(serialized.encode("utf-8"), usedforsecurity=False).hexdigest()
 
-    def list_feedback_for_session(self, session_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+    def _list_feedback(self, params: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
         """
-        Fetch feedback records for an experiment session.
+        Page through /feedback for the given filter.
+
+        The first page is fetched on its own. If it is full, the following
+        offsets are requested a window at a time and consumed in order; the
+        first short or empty page ends the listing and anything requested
+        past it is discarded.
 
         Args:
-            session_id: The experiment session ID to fetch feedback for
+            params: Filter parameters for /feedback (session or run)
             limit: Number of records per page
 
         Returns:
             List of feedback records
         """
-        all_feedback = []
-        offset = 0
-
-        while True:
-            try:
-                response = self.source.get(
-                    "/feedback",
-                    params={"session": session_id, "limit": limit, "offset": offset}
-                )
-
-                # Handle response - could be list directly or dict with items
-                if isinstance(response, list):
-                    feedback_items = response
-                elif isinstance(response, dict):
-                    feedback_items = response.get("feedback", response.get("items", []))
-                else:
-                    break
-
+        def fetch_page(offset: int) -> Optional[List[Dict[str, Any]]]:
+            response = self.source.get(
+                "/feedback",
+                params={**params, "limit": limit, "offset": offset}
+            )
+
+            # Handle response - could be list directly or dict with items
+            if isinstance(response, list):
+                feedback_items = response
+            elif isinstance(response, dict):
+                feedback_items = response.get("feedback", response.get("items", []))
+            else:
+                return None
+
+            if feedback_items:
+                self.log(f"Fetched {len(feedback_items)} feedback records (offset={offset})", "info")
+            return feedback_items
+
+        feedback_items = fetch_page(0)
+        all_feedback = list(feedback_items or [])
+        if not feedback_items or len(feedback_items) < limit:
+            return all_feedback
+
+        window = max(1, self.config.migration.concurrent_workers)
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            pages: Deque["Future[Optional[List[Dict[str, Any]]]]"] = deque(
+                executor.submit(fetch_page, limit * (i + 1)) for i in range(window)
+            )
+            next_offset = limit * (window + 1)
+            while pages:
+                feedback_items = pages.popleft().result()
                 if not feedback_items:
                     break
 
                 all_feedback.extend(feedback_items)
-                self.log(f"Fetched {len(feedback_items)} feedback records (offset={offset})", "info")
 
                 if len(feedback_items) < limit:
                     break
 
-                offset += limit
+                pages.append(executor.submit(fetch_page, next_offset))
+                next_offset += limit
 
-            except Exception as e:
-                self.log(f"Error fetching feedback for session {session_id}: {e}", "error")
-                raise
+            for page in pages:
+                page.cancel()
 
         return all_feedback
 
+    def list_feedback_for_session(self, session_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Fetch feedback records for an experiment session.
+
+        Args:
+            session_id: The experiment session ID to fetch feedback for
+            limit: Number of records per page
+
+        Returns:
+            List of feedback records
+        """
+        try:
+            return self._list_feedback({"session": session_id}, limit)
+        except Exception as e:
+            self.log(f"Error fetching feedback for session {session_id}: {e}", "error")
+            raise
+
     def list_feedback_for_runs(self, run_ids: List[str], limit: int = 100) -> List[Dict[str, Any]]:
         """
         Fetch feedback records for specific runs.
@@ -87,6 +123,8 @@ class FeedbackMigrator(BaseMigrator):
             List of feedback records
         """
         all_feedback = []
+        # A repeated run ID would only query (and return) its feedback twice
+        run_ids = list(dict.fromkeys(run_ids))
 
         # Process in chunks to avoid URL length limits
         chunk_size = 50
@@ -94,34 +132,11 @@ class FeedbackMigrator(BaseMigrator):
             chunk = run_ids[i:i + chunk_size]
             run_param = ",".join(chunk)
 
-            offset = 0
-            while True:
-                try:
-                    response = self.source.get(
-                        "/feedback",
-                        params={"run": run_param, "limit": limit, "offset": offset}
-                    )
-
-                    if isinstance(response, list):
-                        feedback_items = response
-                    elif isinstance(response, dict):
-                        feedback_items = response.get("feedback", response.get("items", []))
-                    else:
-                        break
-
-                    if not feedback_items:
-                        break
-
-                    all_feedback.extend(feedback_items)
-
-                    if len(feedback_items) < limit:
-                        break
-
-                    offset += limit
-
-                except Exception as e:
-                    self.log(f"Error fetching feedback for runs: {e}", "error")
-                    raise
+            try:
+                all_feedback.extend(self._list_feedback({"run": run_param}, limit))
+            except Exception as e:
+                self.log(f"Error fetching feedback for runs: {e}", "error")
+                raise
 
         return all_feedback
 
@@ -152,7 +167,7 @@ class FeedbackMigrator(BaseMigrator):
         Create feedback records in destination.
 
         Note: LangSmith doesn't have a /feedback/batch endpoint,
-        so we create them one at a time.
+        so each record is its own POST; these run concurrently.
 
         Args:
             feedbacks: List of feedback records to create
@@ -164,14 +179,19 @@ class FeedbackMigrator(BaseMigrator):
             self.log(f"[DRY RUN] Would create {len(feedbacks)} feedback records", "info")
             return len(feedbacks), list(feedbacks)
 
-        created = 0
-        created_feedbacks: List[Dict[str, Any]] = []
-        for feedback in feedbacks:
-            if self.create_feedback(feedback):
-                created += 1
-                created_feedbacks.append(feedback)
+        if not feedbacks:
+            return 0, []
+
+        # Fan the independent POSTs out over the client's pooled session;
+        # map() keeps the results in input order.
+        workers = max(1, min(self.config.migration.concurrent_workers, len(feedbacks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.create_feedback, feedbacks))
 
-        return created, created_feedbacks
+        created_feedbacks = [
+            feedback for feedback, created in zip(feedbacks, results) if created
+        ]
+        return len(created_feedbacks), created_feedbacks
 
     def migrate_feedback_for_experiments(
         self,
@@ -200,6 +220,7 @@ class FeedbackMigrator(BaseMigrator):
 
         total_found = 0
         total_migrated = 0
+        verbose = self.config.migration.verbose
 
         for source_exp_id, dest_exp_id in experiment_id_mapping.items():
             self.log(f"Fetching feedback for experiment {source_exp_id}...", "info")
@@ -244,10 +265,11 @@ class FeedbackMigrator(BaseMigrator):
                 fingerprint = self._feedback_fingerprint(source_exp_id, fb)
                 if self.state and self.state.get_mapped_id("feedback_fingerprint", fingerprint):
                     already_replayed += 1
-                    self.log(
-                        f"Skipping feedback '{fb.get('key')}' - already replayed in a prior attempt",
-                        "info",
-                    )
+                    if verbose:
+                        self.log(
+                            f"Skipping feedback '{fb.get('key')}' - already replayed in a prior attempt",
+                            "info",
+                        )
                     continue
 
                 # Map run_id to destination
@@ -257,10 +279,11 @@ class FeedbackMigrator(BaseMigrator):
                     dest_run_id = run_id_mapping.get(source_run_id)
                     if not dest_run_id:
                         # Run wasn't migrated, skip this feedback
-                        self.log(
-                            f"Skipping feedback '{fb.get('key')}' - run {source_run_id} not in mapping",
-                            "warning"
-                        )
+                        if verbose:
+                            self.log(
+                                f"Skipping feedback '{fb.get('key')}' - run {source_run_id} not in mapping",
+                                "warning"
+                            )
                         unmapped_runs += 1
                         continue
                 else:
@@ -272,17 +295,22 @@ class FeedbackMigrator(BaseMigrator):
                     "key": fb["key"],
                 }
 
-                # Add optional fields if present
-                if fb.get("score") is not None:
-                    migrated_fb["score"] = fb["score"]
-                if fb.get("value") is not None:
-                    migrated_fb["value"] = fb["value"]
-                if fb.get("comment"):
-                    migrated_fb["comment"] = fb["comment"]
-                if fb.get("correction"):
-                    migrated_fb["correction"] = fb["correction"]
-                if fb.get("feedback_source"):
-                    migrated_fb["feedback_source"] = fb["feedback_source"]
+                # Add optional fields if present, reading each one once
+                score = fb.get("score")
+                if score is not None:
+                    migrated_fb["score"] = score
+                value = fb.get("value")
+                if value is not None:
+                    migrated_fb["value"] = value
+                comment = fb.get("comment")
+                if comment:
+                    migrated_fb["comment"] = comment
+                correction = fb.get("correction")
+                if correction:
+                    migrated_fb["correction"] = correction
+                feedback_source = fb.get("feedback_source")
+                if feedback_source:
+                    migrated_fb["feedback_source"] = feedback_source
 
                 migrated_fb["_fingerprint"] = fingerprint
                 migrated_feedbacks.append(migrated_fb)
@@ -149,6 +149,7 @@ class MigrationOrchestrator:
 
         # Migrate with concurrency
         id_mapping = {}
+        dataset_migrator.parallel_datasets = min(self.config.migration.concurrent_workers, len(dataset_ids))
 
         with ThreadPoolExecutor(max_workers=self.config.migration.concurrent_workers) as executor:
             futures = {}
@@ -167,77 +168,91 @@ class MigrationOrchestrator:
                 futures[future] = dataset_id
             self.state_manager.save()
 
-            # Process completed migrations
-            with Progress(console=self.console) as progress:
-                task = progress.add_task("Migrating datasets...", total=len(dataset_ids))
-
-                for future in as_completed(futures):
-                    dataset_id = futures[future]
-                    item_id = f"dataset_{dataset_id}"
-
-                    try:
-                        new_id, example_mapping = future.result()
-
-                        # Thread-safe update of shared state
-                        with self._state_lock:
-                            id_mapping[dataset_id] = new_id
-
-                            # Update state
-                            self.state.update_item_status(
-                                item_id,
-                                MigrationStatus.COMPLETED,
-                                destination_id=new_id,
-                                stage="completed",
-                            )
-                            self.state.mark_terminal(
-                                item_id,
-                                ResolutionOutcome.MIGRATED,
-                                "dataset_migrated",
-                                verification_state=VerificationState.VERIFIED,
-                                evidence={"include_examples": include_examples},
-                            )
+            # Saving rewrites the whole state file, so checkpoint every
+            # save_interval completions rather than after each one.
+            save_interval = max(1, len(dataset_ids) // 20)
+            completed = 0
 
-                            # Store example mappings
-                            if example_mapping:
-                                if "examples" not in self.state.id_mappings:
-                                    self.state.id_mappings["examples"] = {}
-                                self.state.id_mappings["examples"].update(example_mapping)
-
-                    except Exception as e:
-                        error_msg = str(e)
-                        # Provide helpful hint for SSL errors
-                        if "SSL" in error_msg or "certificate verify failed" in error_msg:
-                            self.console.print(f"[red]Failed to migrate dataset {dataset_id}:[/red]")
-                            self.console.print("[red]SSL certificate verification failed. Use --no-ssl flag to disable SSL verification.[/red]")
-                        else:
-                            self.console.print(f"[red]Failed to migrate dataset {dataset_id}: {e}[/red]")
+            # Process completed migrations
+            try:
+                with Progress(console=self.console) as progress:
+                    task = progress.add_task("Migrating datasets...", total=len(dataset_ids))
+
+                    for future in as_completed(futures):
+                        dataset_id = futures[future]
+                        item_id = f"dataset_{dataset_id}"
+
+                        try:
+                            new_id, example_mapping = future.result()
+
+                            # Thread-safe update of shared state
+                            with self._state_lock:
+                                id_mapping[dataset_id] = new_id
+
+                                # Update state
+                                self.state.update_item_status(
+                                    item_id,
+                                    MigrationStatus.COMPLETED,
+                                    destination_id=new_id,
+                                    stage="completed",
+                                )
+                                self.state.mark_terminal(
+                                    item_id,
+                                    ResolutionOutcome.MIGRATED,
+                                    "dataset_migrated",
+                                    verification_state=VerificationState.VERIFIED,
+                                    evidence={"include_examples": include_examples},
+                                )
 
-                        # Thread-safe state update
-                        with self._state_lock:
-                            self.state.update_item_status(
-                                item_id,
-                                MigrationStatus.FAILED,
-                                error=str(e)
-                            )
-                            issue = self.state.add_issue(
-                                "transient",
-                                "dataset_migration_failed",
-                                f"Dataset migration failed for {dataset_id}",
-                                item_id=item_id,
-                                next_action="Re-run `langsmith-migrator resume` after reviewing the error.",
-                                evidence={"error": str(e)},
-                                workspace_pair=self.workspace_pair(),
-                            )
-                            self.state.queue_remediation(
-                                issue_id=issue.id,
-                                item_id=item_id,
-                                next_action=issue.next_action or "Resume dataset migration.",
-                                command="langsmith-migrator resume",
-                            )
+                                # Store example mappings
+                                if example_mapping:
+                                    if "examples" not in self.state.id_mappings:
+                                        self.state.id_mappings["examples"] = {}
+                                    self.state.id_mappings["examples"].update(example_mapping)
+
+                        except Exception as e:
+                            error_msg = str(e)
+                            # Provide helpful hint for SSL errors
+                            if "SSL" in error_msg or "certificate verify failed" in error_msg:
+                                self.console.print(f"[red]Failed to migrate dataset {dataset_id}:[/red]")
+                                self.console.print("[red]SSL certificate verification failed. Use --no-ssl flag to disable SSL verification.[/red]")
+                            else:
+                                self.console.print(f"[red]Failed to migrate dataset {dataset_id}: {e}[/red]")
+
+                            # Thread-safe state update
+                            with self._state_lock:
+                                self.state.update_item_status(
+                                    item_id,
+                                    MigrationStatus.FAILED,
+                                    error=str(e)
+                                )
+                                issue = self.state.add_issue(
+                                    "transient",
+                                    "dataset_migration_failed",
+                                    f"Dataset migration failed for {dataset_id}",
+                                    item_id=item_id,
+                                    next_action="Re-run `langsmith-migrator resume` after reviewing the error.",
+                                    evidence={"error": str(e)},
+                                    workspace_pair=self.workspace_pair(),
+                                )
+                                self.state.queue_remediation(
+                                    issue_id=issue.id,
+                                    item_id=item_id,
+                                    next_action=issue.next_action or "Resume dataset migration.",
+                                    command="langsmith-migrator resume",
+                                )
 
-                    progress.advance(task)
+                        progress.advance(task)
 
-                    # Thread-safe save
+                        completed += 1
+                        if completed % save_interval == 0:
+                            # Thread-safe save
+                            with self._state_lock:
+                                self.state_manager.save()
+            finally:
+                # Also on failure or Ctrl-C, so completions since the last
+                # checkpoint (and their example mappings) are not lost.
+                if completed % save_interval:
                     with self._state_lock:
                         self.state_manager.save()
 
@@ -268,15 +283,14 @@ class MigrationOrchestrator:
             self.config
         )
 
-        all_experiments = []
-        experiment_to_dataset = {}
+        # (experiment, source dataset ID, destination dataset ID or None)
+        all_experiments: List[tuple[Dict[str, Any], str, Optional[str]]] = []
 
         # Collect all experiments for these datasets
         for dataset_id in dataset_ids:
+            dest_dataset_id = dataset_id_mapping.get(dataset_id)
             experiments = experiment_migrator.list_experiments(dataset_id)
-            for exp in experiments:
-                all_experiments.append(exp)
-                experiment_to_dataset[exp['id']] = dataset_id
+            all_experiments.extend((exp, dataset_id, dest_dataset_id) for exp in experiments)
 
         if not all_experiments:
             self.console.print("[dim]No experiments found for selected datasets[/dim]")
@@ -284,6 +298,24 @@ class MigrationOrchestrator:
 
         self.console.print(f"Found {len(all_experiments)} experiment(s)")
 
+        tracked = []
+        for experiment, source_dataset_id, dest_dataset_id in all_experiments:
+            item = self.state.ensure_item(
+                f"experiment_{experiment['id']}",
+                "experiment",
+                experiment["name"],
+                experiment["id"],
+                stage="create_experiment",
+                workspace_pair=self.workspace_pair(),
+                metadata={
+                    "source_dataset_id": source_dataset_id,
+                    "dest_dataset_id": dest_dataset_id,
+                },
+            )
+            tracked.append((experiment, source_dataset_id, dest_dataset_id, item))
+
+        self._create_experiments_concurrently(tracked, experiment_migrator)
+
         # Create experiments in destination
         success_count = 0
         failed_items = []
@@ -292,23 +324,9 @@ class MigrationOrchestrator:
         with Progress(console=self.console) as progress:
             task = progress.add_task("Migrating experiments...", total=len(all_experiments))
 
-            for experiment in all_experiments:
+            for experiment, source_dataset_id, dest_dataset_id, item in tracked:
                 source_experiment_id = experiment["id"]
-                source_dataset_id = experiment_to_dataset[source_experiment_id]
-                dest_dataset_id = dataset_id_mapping.get(source_dataset_id)
                 item_id = f"experiment_{source_experiment_id}"
-                item = self.state.ensure_item(
-                    item_id,
-                    "experiment",
-                    experiment["name"],
-                    source_experiment_id,
-                    stage="create_experiment",
-                    workspace_pair=self.workspace_pair(),
-                    metadata={
-                        "source_dataset_id": source_dataset_id,
-                        "dest_dataset_id": dest_dataset_id,
-                    },
-                )
 
                 if item.terminal_state == ResolutionOutcome.MIGRATED.value:
                     success_count += 1
@@ -368,6 +386,113 @@ class MigrationOrchestrator:
             for name, err in failed_items:
                 self.console.print(f"  [red]✗[/red] {name}: {err}")
 
+    def _create_experiments_concurrently(
+        self,
+        tracked: List[tuple[Dict[str, Any], str, Optional[str], MigrationItem]],
+        experiment_migrator: ExperimentMigrator,
+    ) -> None:
+        """Create destination sessions for new experiments ahead of replay.
+
+        Each creation is an independent POST, so they run on a thread pool
+        before the sequential pass, which then finds the destination ID
+        checkpointed and goes straight to runs and feedback. Anything left
+        out here - already created or migrated, dataset not migrated, no
+        usable timestamps, a name repeated within a destination dataset
+        (created first, then updated), or a failed attempt - is handled
+        by the sequential pass exactly as before.
+        """
+        to_create = []
+        seen_names = set()
+        for experiment, source_dataset_id, dest_dataset_id, item in tracked:
+            if not dest_dataset_id:
+                continue
+            name_key = (dest_dataset_id, experiment["name"])
+            if name_key in seen_names:
+                continue
+            seen_names.add(name_key)
+            if (
+                item.terminal_state == ResolutionOutcome.MIGRATED.value
+                or item.destination_id
+                or item.metadata.get("destination_experiment_id")
+            ):
+                continue
+            if item.metadata.get(_TIME_SHIFT_SECONDS_KEY) is None and compute_delta(
+                end_time=experiment.get("end_time"),
+                start_time=experiment.get("start_time"),
+            ) is None:
+                # Leave the missing-timestamp warning to the sequential pass
+                continue
+            to_create.append((experiment, source_dataset_id, dest_dataset_id, item))
+
+        if len(to_create) < 2:
+            return
+
+        def create(entry) -> None:
+            experiment, source_dataset_id, dest_dataset_id, item = entry
+            self._create_destination_experiment(
+                experiment,
+                source_dataset_id,
+                dest_dataset_id,
+                experiment_migrator,
+                self._resolve_experiment_delta(experiment, item),
+            )
+
+        workers = max(1, min(self.config.migration.concurrent_workers, len(to_create)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(create, entry): entry for entry in to_create}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    if self.config.migration.verbose:
+                        experiment = futures[future][0]
+                        self.console.print(
+                            f"[dim]Deferring creation of experiment {experiment['name']}: {e}[/dim]"
+                        )
+
+    def _create_destination_experiment(
+        self,
+        experiment: Dict[str, Any],
+        source_dataset_id: str,
+        dest_dataset_id: str,
+        experiment_migrator: ExperimentMigrator,
+        time_delta: Optional[timedelta],
+    ) -> str:
+        """Create an experiment's destination session and checkpoint its ID."""
+        item_id = f"experiment_{experiment['id']}"
+        with self._state_lock:
+            self.state.update_item_status(
+                item_id,
+                MigrationStatus.IN_PROGRESS,
+                stage="create_experiment",
+            )
+            self.state.update_item_checkpoint(
+                item_id,
+                metadata={
+                    "source_dataset_id": source_dataset_id,
+                    "dest_dataset_id": dest_dataset_id,
+                },
+            )
+            self.state_manager.save()
+        dest_experiment_id = experiment_migrator.create_experiment(
+            experiment,
+            dest_dataset_id,
+            time_delta=time_delta,
+        )
+        with self._state_lock:
+            self.state.update_item_status(
+                item_id,
+                MigrationStatus.IN_PROGRESS,
+                destination_id=dest_experiment_id,
+                stage="migrate_runs",
+            )
+            self.state.update_item_checkpoint(
+                item_id,
+                metadata={"destination_experiment_id": dest_experiment_id},
+            )
+            self.state_manager.save()
+        return dest_experiment_id
+
     def _resolve_experiment_delta(
         self,
         experiment: Dict[str, Any],
@@ -436,35 +561,13 @@ class MigrationOrchestrator:
 
         try:
             if not dest_experiment_id:
-                self.state.update_item_status(
-                    item_id,
-                    MigrationStatus.IN_PROGRESS,
-                    stage="create_experiment",
-                )
-                self.state.update_item_checkpoint(
-                    item_id,
-                    metadata={
-                        "source_dataset_id": source_dataset_id,
-                        "dest_dataset_id": dest_dataset_id,
-                    },
-                )
-                self.state_manager.save()
-                dest_experiment_id = experiment_migrator.create_experiment(
+                dest_experiment_id = self._create_destination_experiment(
                     experiment,
+                    source_dataset_id,
                     dest_dataset_id,
-                    time_delta=time_delta,
-                )
-                self.state.update_item_status(
-                    item_id,
-                    MigrationStatus.IN_PROGRESS,
-                    destination_id=dest_experiment_id,
-                    stage="migrate_runs",
-                )
-                self.state.update_item_checkpoint(
-                    item_id,
-                    metadata={"destination_experiment_id": dest_experiment_id},
+                    experiment_migrator,
+                    time_delta,
                 )
-                self.state_manager.save()
 
             current_item = self.state.get_item(item_id)
             if current_item and current_item.stage in {"pending", "create_experiment", "migrate_runs", "in_progress"}:
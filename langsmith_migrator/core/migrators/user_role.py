@@ -625,7 +625,7 @@ class UserRoleMigrator(BaseMigrator):
     def _workspace_union_hash(self, source_role_ids: set[str]) -> str:
         """Return a short stable hash for a synthetic workspace role union."""
         encoded = json.dumps(sorted(source_role_ids), separators=(",", ":"))
-        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:12]
+        return hashlib.sha256(encoded.encode("utf-8"), usedforsecurity=False).hexdigest()[:12]
 
     def _build_workspace_union_role(
         self,
@@ -6,6 +6,7 @@ The API client uses `requests` (not httpx), so we monkeypatch EnhancedAPIClient
 methods rather than using respx (which is httpx-only).
 """
 
+import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -143,7 +144,7 @@ def test_runs_shifted_consistently_preserves_offsets(tmp_path: Path):
             captured_session_payload.update(data)
             return {"id": "new-exp-1"}
         if endpoint == "/runs/batch":
-            captured_batches.append(data)
+            captured_batches.append(json.loads(data))
             return {"errors": []}
         raise AssertionError(f"Unexpected dest POST: {endpoint!r}")
 
@@ -9,6 +9,7 @@ import pytest
 import requests
 
 from langsmith_migrator.core.api_client import (
+    HTTP_POOL_MAXSIZE,
     ConflictError,
     EnhancedAPIClient,
     NotFoundError,
@@ -74,11 +75,35 @@ def test_post_uses_prepared_url_payload_and_timeout(monkeypatch):
     assert result == {"id": "member-1"}
     post_mock.assert_called_once_with(
         url,
-        json={"email": "alice@example.com"},
+        data=b'{"email":"alice@example.com"}',
+        headers={"Content-Type": "application/json"},
         timeout=12,
     )
 
 
+def test_post_body_falls_back_to_stdlib_json_for_wide_integers(monkeypatch):
+    client = _client()
+    url = "https://langsmith.example.com/api/v1/runs/batch"
+    post_mock = Mock(return_value=_response("POST", url, 200, json_body={}))
+    monkeypatch.setattr(client.session, "post", post_mock)
+
+    client.post("/runs/batch", {"post": [{"n": 2**70}]})
+
+    assert json.loads(post_mock.call_args.kwargs["data"]) == {"post": [{"n": 2**70}]}
+
+
+def test_post_sends_pre_encoded_body_unchanged(monkeypatch):
+    client = _client()
+    url = "https://langsmith.example.com/api/v1/runs/batch"
+    post_mock = Mock(return_value=_response("POST", url, 200, json_body={}))
+    monkeypatch.setattr(client.session, "post", post_mock)
+    body = b'{"post":[{"id":"run-1"}]}'
+
+    client.post("/runs/batch", body)
+
+    assert post_mock.call_args.kwargs["data"] is body
+
+
 def test_get_uses_prepared_url_query_params_and_timeout(monkeypatch):
     client = _client()
     url = "https://langsmith.example.com/api/v1/workspaces"
@@ -95,6 +120,15 @@ def test_get_uses_prepared_url_query_params_and_timeout(monkeypatch):
     )
 
 
+def test_session_pool_holds_more_connections_than_requests_default():
+    client = _client()
+
+    adapter = client.session.get_adapter("https://langsmith.example.com/api/v1/runs/batch")
+
+    assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+    assert HTTP_POOL_MAXSIZE > requests.adapters.DEFAULT_POOLSIZE
+
+
 def test_set_workspace_updates_scoping_header():
     client = _client()
 
@@ -337,6 +371,17 @@ def test_get_raises_api_error_on_invalid_json_success_response(monkeypatch):
     assert get_mock.call_count == 1
 
 
+def test_get_decodes_json_bodies_orjson_cannot_read(monkeypatch):
+    client = _client()
+    url = "https://langsmith.example.com/api/v1/workspaces"
+    response = _response("GET", url, 200)
+    response._content = json.dumps([{"id": "ws-1"}]).encode("utf-16")
+    response.encoding = "utf-16"
+    monkeypatch.setattr(client.session, "get", Mock(return_value=response))
+
+    assert client.get("/workspaces") == [{"id": "ws-1"}]
+
+
 def test_prepare_url_root_relative_bypasses_api_v1():
     """Endpoints starting with /v1/ should resolve to the host root, not /api/v1."""
     client = _client()
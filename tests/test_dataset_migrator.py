@@ -0,0 +1,273 @@
+"""Tests for DatasetMigrator."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langsmith_migrator.core.migrators.dataset import BatchedExample, DatasetMigrator
+from langsmith_migrator.utils.config import Config
+
+
+def _make_migrator():
+    config = Config(
+        source_api_key="s",
+        dest_api_key="d",
+        source_url="https://s.test",
+        dest_url="https://d.test",
+    )
+    source = Mock()
+    dest = Mock()
+    dest.base_url = "https://d.test/api/v1"
+    dest.headers = {"X-API-Key": "d"}
+    return DatasetMigrator(source, dest, None, config)
+
+
+class TestHashInputs:
+    def test_key_order_does_not_change_hash(self):
+        migrator = _make_migrator()
+        assert migrator._hash_inputs({"a": 1, "b": [1, 2]}) == migrator._hash_inputs(
+            {"b": [1, 2], "a": 1}
+        )
+
+    def test_different_inputs_hash_differently(self):
+        migrator = _make_migrator()
+        assert migrator._hash_inputs({"q": "a"}) != migrator._hash_inputs({"q": "b"})
+
+    def test_values_orjson_rejects_still_hash(self):
+        migrator = _make_migrator()
+        huge = {"n": 2**70}
+        assert migrator._hash_inputs(huge) == migrator._hash_inputs({"n": 2**70})
+
+
+class TestPayloadBuilders:
+    def test_create_dataset_drops_none_fields(self, sample_dataset):
+        migrator = _make_migrator()
+        migrator.dest.post = Mock(return_value={"id": "new-ds"})
+        dataset = {**sample_dataset, "metadata": None, "data_type": None}
+        dataset.pop("externally_managed", None)
+
+        assert migrator.create_dataset(dataset) == "new-ds"
+
+        payload = migrator.dest.post.call_args[0][1]
+        assert "metadata" not in payload
+        assert "data_type" not in payload
+        assert payload["externally_managed"] is False
+        assert payload["created_at"] == sample_dataset["created_at"]
+
+    def test_update_example_drops_none_fields(self):
+        migrator = _make_migrator()
+        migrator.update_example("dest-1", {"inputs": {"q": 1}, "outputs": None, "metadata": {}})
+
+        migrator.dest.patch.assert_called_once_with(
+            "/examples/dest-1", {"inputs": {"q": 1}, "metadata": {}}
+        )
+
+
+class TestGetExistingExamples:
+    def test_indexes_example_ids_by_inputs_hash(self):
+        migrator = _make_migrator()
+        migrator.dest.get_paginated = Mock(return_value=iter([
+            {"id": "dest-1", "inputs": {"q": 1}, "outputs": {"a": 1}},
+            {"id": "dest-2", "inputs": {}},
+        ]))
+
+        existing = migrator.get_existing_examples("dest-ds")
+
+        assert existing == {migrator._hash_inputs({"q": 1}): "dest-1"}
+        params = migrator.dest.get_paginated.call_args.kwargs["params"]
+        assert params["select"] == ["id", "inputs"]
+
+
+class TestMigrateExamplesStreaming:
+    def _examples(self, count):
+        return [
+            {"id": f"src-{i}", "inputs": {"q": i}, "outputs": {"a": i}, "metadata": {}}
+            for i in range(count)
+        ]
+
+    def test_creates_and_updates_across_batches(self):
+        migrator = _make_migrator()
+        migrator.config.migration.batch_size = 2
+        existing = {migrator._hash_inputs({"q": 0}): "dest-0"}
+        migrator.get_existing_examples = Mock(return_value=existing)
+        migrator.stream_examples = Mock(return_value=iter(self._examples(5)))
+        migrator.dest.post_batch = Mock(
+            side_effect=lambda endpoint, payloads, batch_size: [
+                {"id": f"new-{p['inputs']['q']}"} for p in payloads
+            ]
+        )
+        progress = []
+
+        mapping = migrator.migrate_examples_streaming(
+            "src-ds", "dest-ds", progress_callback=progress.append
+        )
+
+        assert mapping == {
+            "src-0": "dest-0",
+            "src-1": "new-1",
+            "src-2": "new-2",
+            "src-3": "new-3",
+            "src-4": "new-4",
+        }
+        migrator.dest.patch.assert_called_once()
+        assert migrator.dest.patch.call_args[0][0] == "/examples/dest-0"
+        assert progress[-1] == 5
+
+    def test_source_errors_propagate_to_caller(self):
+        migrator = _make_migrator()
+
+        def broken_stream(dataset_id):
+            yield self._examples(1)[0]
+            raise RuntimeError("source went away")
+
+        migrator.get_existing_examples = Mock(return_value={})
+        migrator.stream_examples = broken_stream
+        migrator.dest.post_batch = Mock(return_value=[])
+
+        with pytest.raises(RuntimeError, match="source went away"):
+            migrator.migrate_examples_streaming("src-ds", "dest-ds")
+
+
+class TestApplyExampleUpdates:
+    def test_failed_patch_is_not_mapped(self):
+        migrator = _make_migrator()
+        migrator.config.migration.concurrent_workers = 4
+
+        def patch(endpoint, payload):
+            if endpoint == "/examples/dest-bad":
+                raise RuntimeError("boom")
+            return {}
+
+        migrator.dest.patch = Mock(side_effect=patch)
+        updates = [
+            (f"src-{i}", f"dest-{i}", {"inputs": {"q": i}}) for i in range(6)
+        ] + [("src-bad", "dest-bad", {"inputs": {"q": "bad"}})]
+        mapping = {}
+
+        updated = migrator._apply_example_updates(updates, mapping)
+
+        assert updated == 6
+        assert "src-bad" not in mapping
+        assert mapping["src-5"] == "dest-5"
+        assert migrator.dest.patch.call_count == 7
+
+    def test_update_pool_shares_connections_with_parallel_datasets(self):
+        migrator = _make_migrator()
+        migrator.config.migration.concurrent_workers = 10
+        migrator.parallel_datasets = 10
+        lock = threading.Lock()
+        active = peak = 0
+
+        def patch_example(endpoint, payload):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return {}
+
+        migrator.dest.patch = Mock(side_effect=patch_example)
+        updates = [(f"src-{i}", f"dest-{i}", {"inputs": {"q": i}}) for i in range(20)]
+
+        assert migrator._apply_example_updates(updates, {}) == 20
+        # Ten datasets at three PATCHes each stay within HTTP_POOL_MAXSIZE (32)
+        assert peak <= 3
+
+
+class TestSdkClient:
+    def test_client_is_built_once_and_reused(self):
+        migrator = _make_migrator()
+        with patch("langsmith_migrator.core.migrators.dataset.Client") as client_cls:
+            first = migrator._get_ls_client()
+            second = migrator._get_ls_client()
+
+        assert first is second
+        client_cls.assert_called_once()
+        assert client_cls.call_args.kwargs["api_url"] == "https://d.test"
+
+
+class TestCreateExamplesWithAttachments:
+    def _batched(self, tmp_path, count):
+        batch = []
+        for i in range(count):
+            path = tmp_path / f"att-{i}.txt"
+            path.write_bytes(b"data")
+            batch.append(BatchedExample(
+                f"src-{i}",
+                {"inputs": {"q": i}, "outputs": {}, "metadata": {}},
+                {"attachment.doc.txt": ("text/plain", str(path), "doc.txt", 4)},
+            ))
+        return batch
+
+    def test_groups_by_downloaded_sizes_without_statting_files(self, monkeypatch):
+        monkeypatch.setattr(
+            "langsmith_migrator.core.migrators.dataset.SDK_UPLOAD_BYTE_BUDGET", 100
+        )
+        migrator = _make_migrator()
+        # The paths do not exist; only the recorded sizes are read
+        examples = [
+            BatchedExample(f"src-{i}", {}, {"a": ("text/plain", f"/missing/{i}", "a.txt", 60)})
+            for i in range(3)
+        ]
+
+        chunks = list(migrator._chunk_by_attachment_bytes(examples))
+
+        assert [[ex.original_id for ex in chunk] for chunk in chunks] == [["src-0"], ["src-1"], ["src-2"]]
+
+    def test_uploads_batch_in_one_sdk_call(self, tmp_path):
+        migrator = _make_migrator()
+        client = Mock()
+        client.create_examples.return_value = {"example_ids": ["new-0", "new-1"], "count": 2}
+        migrator._ls_client = client
+
+        mapping = migrator.create_examples_with_attachments("dest-ds", self._batched(tmp_path, 2))
+
+        assert mapping == {"src-0": "new-0", "src-1": "new-1"}
+        client.create_examples.assert_called_once()
+        assert len(client.create_examples.call_args.kwargs["examples"]) == 2
+        assert not list(tmp_path.iterdir())
+
+    def test_failed_batch_is_retried_per_example(self, tmp_path):
+        migrator = _make_migrator()
+        client = Mock()
+
+        def create_examples(dataset_id, examples):
+            if len(examples) > 1 or examples[0]["inputs"] == {"q": 1}:
+                raise RuntimeError("422 bad example")
+            return {"example_ids": [f"new-{examples[0]['inputs']['q']}"]}
+
+        client.create_examples.side_effect = create_examples
+        migrator._ls_client = client
+        migrator.dest.get_paginated.return_value = iter([])
+
+        mapping = migrator.create_examples_with_attachments("dest-ds", self._batched(tmp_path, 3))
+
+        assert mapping == {"src-0": "new-0", "src-2": "new-2"}
+        assert client.create_examples.call_count == 4
+
+    def test_failed_batch_maps_examples_it_already_created(self, tmp_path):
+        migrator = _make_migrator()
+        client = Mock()
+
+        def create_examples(dataset_id, examples):
+            if len(examples) > 1:
+                raise RuntimeError("504 gateway timeout")
+            return {"example_ids": [f"new-{examples[0]['inputs']['q']}"]}
+
+        client.create_examples.side_effect = create_examples
+        migrator._ls_client = client
+        # The timed-out request still wrote the first two examples
+        migrator.dest.get_paginated.return_value = iter([
+            {"id": "committed-0", "inputs": {"q": 0}},
+            {"id": "committed-1", "inputs": {"q": 1}},
+        ])
+
+        mapping = migrator.create_examples_with_attachments("dest-ds", self._batched(tmp_path, 3))
+
+        assert mapping == {"src-0": "committed-0", "src-1": "committed-1", "src-2": "new-2"}
+        assert client.create_examples.call_count == 2
+        migrator.dest.get_paginated.assert_called_once()
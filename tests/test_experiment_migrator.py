@@ -1,10 +1,14 @@
 """Tests for ExperimentMigrator."""
 
+import json
+import threading
+import time
+from collections import ChainMap
 from datetime import timedelta
 from pathlib import Path
 from unittest.mock import Mock
 
-from langsmith_migrator.core.migrators.experiment import ExperimentMigrator
+from langsmith_migrator.core.migrators.experiment import ExperimentMigrator, PendingRun
 from langsmith_migrator.core.migrators.orchestrator import MigrationOrchestrator
 from langsmith_migrator.utils.config import Config
 from langsmith_migrator.utils.state import MigrationStatus, ResolutionOutcome, StateManager
@@ -64,6 +68,245 @@ class TestCreateExperimentTimeShift:
         assert sent_payload["end_time"] == "2026-02-03T01:00:00+00:00"
 
 
+class TestCreateExperimentDryRun:
+    def test_existing_experiment_is_reported_as_update_without_writing(self):
+        migrator = _make_migrator()
+        migrator.config.migration.dry_run = True
+        migrator.dest.get_paginated = Mock(return_value=iter([{"id": "dest-exp", "name": "exp"}]))
+
+        result = migrator.create_experiment({"id": "src-exp", "name": "exp"}, "dest-dataset-id")
+
+        assert result == "dest-exp"
+        migrator.dest.get_paginated.assert_called_once()
+        migrator.dest.patch.assert_not_called()
+        migrator.dest.post.assert_not_called()
+
+    def test_missing_experiment_is_reported_as_create_without_writing(self):
+        migrator = _make_migrator()
+        migrator.config.migration.dry_run = True
+        migrator.dest.get_paginated = Mock(return_value=iter([]))
+
+        result = migrator.create_experiment({"id": "src-exp", "name": "exp"}, "dest-dataset-id")
+
+        assert result == "dry-run-src-exp"
+        migrator.dest.get_paginated.assert_called_once()
+        migrator.dest.post.assert_not_called()
+
+
+class TestUpdateExperiment:
+    def test_patch_omits_none_fields(self):
+        migrator = _make_migrator()
+
+        migrator.update_experiment(
+            "dest-exp", {"name": "exp", "description": None, "extra": None, "trace_tier": "longlived"}
+        )
+
+        migrator.dest.patch.assert_called_once_with(
+            "/sessions/dest-exp", {"name": "exp", "trace_tier": "longlived"}
+        )
+
+
+class TestEnsureEvaluatorTypes:
+    def test_fills_missing_fields_without_mutating_source(self):
+        migrator = _make_migrator()
+        extra = {
+            "evaluators": [{"name": "correctness", "model": "gpt"}],
+            "metadata": {"git": {"sha": "abc"}},
+        }
+
+        result = migrator._ensure_evaluator_types(extra)
+
+        assert result["evaluators"][0]["type"] == "LLM"
+        assert result["evaluators"][0]["feedback_key"] == "correctness"
+        assert extra["evaluators"][0] == {"name": "correctness", "model": "gpt"}
+        assert result["metadata"] is extra["metadata"]
+
+    def test_feedback_key_inference_priority(self):
+        migrator = _make_migrator()
+        evaluators = [
+            {"key": "k", "name": "n", "type": "Code"},
+            {"name": "", "metric_name": "m", "type": "Code"},
+            {"id": "eval-id", "type": "Code"},
+        ]
+
+        result = migrator._ensure_evaluator_types({"evaluators": evaluators})
+
+        assert [e["feedback_key"] for e in result["evaluators"]] == ["k", "m", "eval-id"]
+
+    def test_extra_without_evaluators_is_returned_as_is(self):
+        migrator = _make_migrator()
+        extra = {"metadata": {"git": {"sha": "abc"}}}
+
+        assert migrator._ensure_evaluator_types(extra) is extra
+
+    def test_generated_feedback_key_is_stable_across_key_order(self):
+        migrator = _make_migrator()
+
+        first = migrator._ensure_evaluator_types({"evaluators": [{"code": "x", "id": 1}]})
+        second = migrator._ensure_evaluator_types({"evaluators": [{"id": 1, "code": "x"}]})
+
+        key = first["evaluators"][0]["feedback_key"]
+        assert key.startswith("evaluator_")
+        assert key == second["evaluators"][0]["feedback_key"]
+
+    def test_type_inference_priority(self):
+        migrator = _make_migrator()
+        evaluators = [
+            {"name": "a", "eval_type": "LLM", "code": "x"},
+            {"name": "b", "code": "x", "model": "gpt"},
+            {"name": "c", "model": "gpt"},
+            {"name": "d", "__class__": "ChatEvaluator"},
+            {"name": "e", "__class__": "ExactMatch"},
+            {"name": "f"},
+        ]
+
+        result = migrator._ensure_evaluator_types({"evaluators": evaluators})
+
+        assert [e["type"] for e in result["evaluators"]] == ["LLM", "Code", "LLM", "LLM", "Code", "Code"]
+
+
+class TestListExperiments:
+    def test_fetches_details_in_listing_order_with_summary_fallback(self):
+        migrator = _make_migrator()
+        migrator.source.get_paginated = Mock(return_value=iter([
+            {"id": f"exp-{i}", "name": f"summary-{i}", "extra": None} for i in range(6)
+        ]))
+
+        def get(endpoint):
+            exp_id = endpoint.rsplit("/", 1)[-1]
+            if exp_id == "exp-3":
+                raise RuntimeError("404")
+            return {"id": exp_id, "name": f"full-{exp_id}"}
+
+        migrator.source.get = Mock(side_effect=get)
+
+        experiments = migrator.list_experiments("src-ds")
+
+        assert [e["name"] for e in experiments] == [
+            "full-exp-0", "full-exp-1", "full-exp-2", "summary-3", "full-exp-4", "full-exp-5",
+        ]
+
+    def test_listing_that_includes_extra_skips_detail_fetch(self):
+        migrator = _make_migrator()
+        migrator.source.get_paginated = Mock(return_value=iter([
+            {"id": "exp-0", "name": "exp", "extra": {"evaluators": []}},
+        ]))
+
+        experiments = migrator.list_experiments("src-ds")
+
+        assert experiments == [{"id": "exp-0", "name": "exp", "extra": {"evaluators": []}}]
+        migrator.source.get.assert_not_called()
+
+    def test_listing_extra_without_evaluators_still_fetches_details(self):
+        migrator = _make_migrator()
+        migrator.source.get_paginated = Mock(return_value=iter([
+            {"id": "exp-0", "name": "exp", "extra": {"metadata": {"model": "m"}}},
+        ]))
+        full = {
+            "id": "exp-0",
+            "name": "exp",
+            "extra": {"metadata": {"model": "m"}, "evaluators": [{"name": "judge"}]},
+        }
+        migrator.source.get = Mock(return_value=full)
+
+        experiments = migrator.list_experiments("src-ds")
+
+        assert experiments == [full]
+        migrator.source.get.assert_called_once_with("/sessions/exp-0")
+
+
+class TestFindExistingExperiment:
+    def test_destination_sessions_are_listed_once_per_dataset(self):
+        migrator = _make_migrator()
+        migrator.dest.get_paginated = Mock(return_value=iter([
+            {"id": "dest-1", "name": "exp-1"},
+            {"id": "dest-2", "name": "exp-2"},
+        ]))
+
+        assert migrator.find_existing_experiment("exp-1", "dest-ds") == "dest-1"
+        assert migrator.find_existing_experiment("exp-2", "dest-ds") == "dest-2"
+        assert migrator.find_existing_experiment("exp-3", "dest-ds") is None
+        migrator.dest.get_paginated.assert_called_once()
+
+    def test_created_experiment_is_found_without_relisting(self):
+        migrator = _make_migrator()
+        migrator.dest.get_paginated = Mock(return_value=iter([]))
+        migrator.dest.post = Mock(return_value={"id": "new-exp-id"})
+        experiment = {"id": "src-exp", "name": "exp"}
+
+        migrator.create_experiment(experiment, "dest-ds")
+
+        assert migrator.find_existing_experiment("exp", "dest-ds") == "new-exp-id"
+        migrator.dest.get_paginated.assert_called_once()
+
+    def test_concurrent_creations_share_one_listing(self):
+        migrator = _make_migrator()
+        start = threading.Barrier(2, timeout=5)
+
+        def list_sessions(endpoint, params=None):
+            # A slow listing gives a second, unguarded lister time to start
+            time.sleep(0.05)
+            return iter([])
+
+        migrator.dest.get_paginated = Mock(side_effect=list_sessions)
+        migrator.dest.post = Mock(side_effect=lambda endpoint, payload: {"id": f"new-{payload['name']}"})
+
+        def create(name):
+            start.wait()
+            migrator.create_experiment({"id": f"src-{name}", "name": name}, "dest-ds")
+
+        threads = [threading.Thread(target=create, args=(name,)) for name in ("exp-a", "exp-b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        migrator.dest.get_paginated.assert_called_once()
+        assert migrator.find_existing_experiment("exp-a", "dest-ds") == "new-exp-a"
+        assert migrator.find_existing_experiment("exp-b", "dest-ds") == "new-exp-b"
+
+    def test_failed_listing_is_not_cached(self):
+        migrator = _make_migrator()
+        migrator.dest.get_paginated = Mock(side_effect=[
+            RuntimeError("timeout"),
+            iter([{"id": "dest-1", "name": "exp-1"}]),
+        ])
+
+        assert migrator.find_existing_experiment("exp-1", "dest-ds") is None
+        assert migrator.find_existing_experiment("exp-1", "dest-ds") == "dest-1"
+
+
+class TestRegenerateDottedOrder:
+    def test_ancestors_resolve_through_layered_mappings(self):
+        migrator = _make_migrator()
+        mapping = ChainMap({"parent": "pending-parent"}, {"root": "legacy-root", "parent": "stale"})
+
+        result = migrator._regenerate_dotted_order(
+            "20260203T000000000000Zroot.20260203T000000000001Zparent"
+            ".20260203T000000000002Zother.20260203T000000000003Zchild",
+            mapping,
+            "new-child",
+        )
+
+        assert result.split(".") == [
+            "20260203T000000000000Zlegacy-root",
+            "20260203T000000000001Zpending-parent",
+            "20260203T000000000002Z" + migrator._deterministic_run_id("other"),
+            "20260203T000000000003Znew-child",
+        ]
+
+    def test_root_run_only_takes_its_new_id(self):
+        migrator = _make_migrator()
+        mapping = Mock()
+
+        assert (
+            migrator._regenerate_dotted_order("20260203T000000000000Zroot", mapping, "new-root")
+            == "20260203T000000000000Znew-root"
+        )
+        assert migrator._regenerate_dotted_order("no-separator", mapping, "new-root") == "no-separator"
+        mapping.get.assert_not_called()
+
+
 class TestMigrateRunsStreamingTimeShift:
     def test_runs_get_shifted_timestamps(self):
         migrator = _make_migrator()
@@ -105,7 +348,7 @@ class TestMigrateRunsStreamingTimeShift:
             time_deltas={"src-exp": timedelta(days=1)},
         )
 
-        batch_payload = captured_batches[0]
+        batch_payload = json.loads(captured_batches[0])
         sent_run = batch_payload["post"][0]
         assert sent_run["start_time"] == "2026-02-04T00:00:00.000000+00:00"
         assert sent_run["end_time"] == "2026-02-04T00:00:05.000000+00:00"
@@ -146,10 +389,256 @@ class TestMigrateRunsStreamingTimeShift:
                 "examples": {},
             },
         )
-        sent = captured[0]["post"][0]
+        sent = json.loads(captured[0])["post"][0]
         assert sent["start_time"] == "2026-02-03T00:00:00+00:00"
 
 
+def _source_run(run_id):
+    return {
+        "id": run_id,
+        "name": run_id,
+        "run_type": "chain",
+        "session_id": "src-exp",
+        "dotted_order": f"20260203T000000000000Z{run_id}",
+    }
+
+
+class TestMigrateRunsStreamingPipeline:
+    def test_all_pages_and_batches_are_uploaded(self):
+        migrator = _make_migrator()
+        migrator.config.migration.batch_size = 1
+        pages = {
+            None: {"runs": [_source_run("run-a"), _source_run("run-b")], "cursors": {"next": "c2"}},
+            "c2": {"runs": [_source_run("run-c")], "cursors": {"next": None}},
+        }
+        migrator.source.post = Mock(side_effect=lambda path, payload: pages[payload.get("cursor")])
+        migrator.dest.post = Mock(return_value={"errors": []})
+
+        total, mapping, failed = migrator.migrate_runs_streaming(
+            ["src-exp"], {"experiments": {"src-exp": "dest-exp"}, "examples": {}}
+        )
+
+        assert (total, failed) == (3, 0)
+        assert set(mapping) == {"run-a", "run-b", "run-c"}
+        assert migrator.dest.post.call_count == 3
+
+    def test_parents_are_uploaded_before_children(self):
+        migrator = _make_migrator()
+        root = _source_run("root")
+        child = {**_source_run("child"), "dotted_order": root["dotted_order"] + ".20260203T000000000001Zchild"}
+        migrator.source.post = Mock(return_value={"runs": [child, root], "cursors": {"next": None}})
+        migrator.dest.post = Mock(return_value={"errors": []})
+
+        migrator.migrate_runs_streaming(
+            ["src-exp"], {"experiments": {"src-exp": "dest-exp"}, "examples": {}}
+        )
+
+        sent = json.loads(migrator.dest.post.call_args.args[1])["post"]
+        assert [run["name"] for run in sent] == ["root", "child"]
+
+    def test_child_batch_waits_for_parent_batches_in_flight(self):
+        migrator = _make_migrator()
+        migrator.config.migration.batch_size = 1
+        migrator.config.migration.concurrent_workers = 4
+        roots = [_source_run("root-a"), _source_run("root-b")]
+        child = {**_source_run("child"), "dotted_order": roots[0]["dotted_order"] + ".20260203T000000000001Zchild"}
+        migrator.source.post = Mock(return_value={"runs": [child, *roots], "cursors": {"next": None}})
+        both_roots_sent = threading.Barrier(2)
+        landed = []
+
+        def upload(path, payload):
+            name = json.loads(payload)["post"][0]["name"]
+            if name.startswith("root"):
+                # Same-depth batches still upload side by side; the pause gives
+                # a prematurely submitted child time to overtake them.
+                both_roots_sent.wait(timeout=5)
+                time.sleep(0.05)
+            else:
+                assert sorted(landed) == ["root-a", "root-b"]
+            landed.append(name)
+            return {"errors": []}
+
+        migrator.dest.post = Mock(side_effect=upload)
+
+        total, _, failed = migrator.migrate_runs_streaming(
+            ["src-exp"], {"experiments": {"src-exp": "dest-exp"}, "examples": {}}
+        )
+
+        assert (total, failed) == (3, 0)
+        assert landed[-1] == "child"
+
+    def test_uploads_in_flight_match_concurrent_workers(self):
+        migrator = _make_migrator()
+        migrator.config.migration.batch_size = 1
+        migrator.config.migration.concurrent_workers = 3
+        runs = [_source_run(f"run-{i}") for i in range(6)]
+        migrator.source.post = Mock(return_value={"runs": runs, "cursors": {"next": None}})
+        lock = threading.Lock()
+        active = peak = 0
+        # Every group of three uploads must be in flight together to pass
+        full_width = threading.Barrier(3, timeout=5)
+
+        def upload(path, body):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                full_width.wait()
+                time.sleep(0.01)
+            finally:
+                with lock:
+                    active -= 1
+            return {"errors": []}
+
+        migrator.dest.post = Mock(side_effect=upload)
+
+        total, _, failed = migrator.migrate_runs_streaming(
+            ["src-exp"], {"experiments": {"src-exp": "dest-exp"}, "examples": {}}
+        )
+
+        assert (total, failed) == (6, 0)
+        assert peak == 3
+
+    def test_next_page_is_requested_before_current_page_uploads(self):
+        migrator = _make_migrator()
+        prefetched = threading.Event()
+        pages = {
+            None: {"runs": [_source_run("run-a")], "cursors": {"next": "c2"}},
+            "c2": {"runs": [], "cursors": {"next": None}},
+        }
+
+        def query(path, payload):
+            if payload.get("cursor") == "c2":
+                prefetched.set()
+            return pages[payload.get("cursor")]
+
+        def upload(path, payload):
+            # Without prefetch the c2 query only starts after this returns.
+            assert prefetched.wait(timeout=5)
+            return {"errors": []}
+
+        migrator.source.post = Mock(side_effect=query)
+        migrator.dest.post = Mock(side_effect=upload)
+
+        total, _, failed = migrator.migrate_runs_streaming(
+            ["src-exp"], {"experiments": {"src-exp": "dest-exp"}, "examples": {}}
+        )
+
+        assert (total, failed) == (1, 0)
+
+    def test_large_runs_flush_before_batch_size(self, monkeypatch):
+        monkeypatch.setattr(
+            "langsmith_migrator.core.migrators.experiment.RUN_BATCH_BYTE_BUDGET", 1000
+        )
+        migrator = _make_migrator()
+        runs = [_source_run(f"run-{i}") for i in range(4)]
+        for run in runs:
+            run["inputs"] = {"blob": "x" * 600}
+        migrator.source.post = Mock(return_value={"runs": runs, "cursors": {"next": None}})
+        migrator.dest.post = Mock(return_value={"errors": []})
+
+        total, _, _ = migrator.migrate_runs_streaming(
+            ["src-exp"], {"experiments": {"src-exp": "dest-exp"}, "examples": {}}
+        )
+
+        assert total == 4
+        assert [len(json.loads(c.args[1])["post"]) for c in migrator.dest.post.call_args_list] == [2, 2]
+
+    def test_unmapped_and_repeated_experiments_are_queried_once_at_most(self):
+        migrator = _make_migrator()
+        migrator.source.post = Mock(return_value={"runs": [], "cursors": {"next": None}})
+
+        result = migrator.migrate_runs_streaming(
+            ["src-exp", "other-exp", "src-exp"],
+            {"experiments": {"src-exp": "dest-exp"}, "examples": {}},
+        )
+
+        assert result == (0, {}, 0)
+        migrator.source.post.assert_called_once()
+        assert migrator.source.post.call_args.args[1]["session"] == ["src-exp"]
+
+    def test_no_mapped_experiments_makes_no_requests(self):
+        migrator = _make_migrator()
+
+        result = migrator.migrate_runs_streaming(
+            ["src-exp"], {"experiments": {}, "examples": {}}
+        )
+
+        assert result == (0, {}, 0)
+        migrator.source.post.assert_not_called()
+
+    def test_unencodable_run_fails_alone(self):
+        migrator = _make_migrator()
+        bad = {**_source_run("run-bad"), "outputs": {"value": object()}}
+        migrator.source.post = Mock(
+            return_value={"runs": [_source_run("run-a"), bad], "cursors": {"next": None}}
+        )
+        migrator.dest.post = Mock(return_value={"errors": []})
+
+        total, mapping, failed = migrator.migrate_runs_streaming(
+            ["src-exp"], {"experiments": {"src-exp": "dest-exp"}, "examples": {}}
+        )
+
+        assert (total, failed) == (1, 1)
+        assert set(mapping) == {"run-a"}
+        sent = json.loads(migrator.dest.post.call_args.args[1])["post"]
+        assert [run["name"] for run in sent] == ["run-a"]
+
+    def test_page_with_failed_upload_stops_pagination(self):
+        migrator = _make_migrator()
+        pages = {
+            None: {"runs": [_source_run("run-a")], "cursors": {"next": "c2"}},
+            "c2": {"runs": [_source_run("run-b")], "cursors": {"next": None}},
+        }
+        migrator.source.post = Mock(side_effect=lambda path, payload: pages[payload.get("cursor")])
+        migrator.dest.post = Mock(side_effect=RuntimeError("500 from /runs/batch"))
+
+        total, mapping, failed = migrator.migrate_runs_streaming(
+            ["src-exp"], {"experiments": {"src-exp": "dest-exp"}, "examples": {}}
+        )
+
+        assert (total, failed) == (0, 1)
+        assert mapping == {}
+        migrator.dest.post.assert_called_once()
+
+
+class TestCreateRunsBatch:
+    def _runs(self, count):
+        return [
+            PendingRun(f"run-{i}", {"id": f"new-{i}", "name": f"run-{i}"})
+            for i in range(count)
+        ]
+
+    def test_failed_batch_is_split_down_to_the_bad_run(self):
+        migrator = _make_migrator()
+        posted = []
+
+        def post(endpoint, body):
+            runs = json.loads(body)["post"]
+            posted.append(runs)
+            if any(run["name"] == "run-2" for run in runs):
+                raise RuntimeError("422 invalid run")
+            return {"errors": []}
+
+        migrator.dest.post = Mock(side_effect=post)
+
+        created, failed = migrator._create_runs_batch(self._runs(4))
+
+        assert created == {"run-0": "new-0", "run-1": "new-1", "run-3": "new-3"}
+        assert [entry["source_run_id"] for entry in failed] == ["run-2"]
+        assert posted[0] == [{"id": f"new-{i}", "name": f"run-{i}"} for i in range(4)]
+
+    def test_conflict_on_single_run_counts_as_replayed(self):
+        migrator = _make_migrator()
+        migrator.dest.post = Mock(side_effect=RuntimeError("409 Conflict"))
+
+        created, failed = migrator._create_runs_batch(self._runs(1))
+
+        assert created == {"run-0": "new-0"}
+        assert failed == []
+
+
 def _orchestrator(tmp_path: Path):
     config = Config(
         source_api_key="s", dest_api_key="d",
@@ -324,3 +813,68 @@ class TestOrchestratorDeltaPersistence:
         assert ok is True
         assert exp_mig.create_experiment.call_args.kwargs["time_delta"] is None
         assert exp_mig.migrate_runs_streaming.call_args.kwargs["time_deltas"] is None
+
+
+class TestMigrateExperimentsForDatasets:
+    def test_experiments_resolve_against_their_own_dataset(self, tmp_path, monkeypatch):
+        orchestrator, _ = _orchestrator(tmp_path)
+        state = orchestrator.ensure_state()
+        listings = {
+            "ds-a": [{"id": "exp-a", "name": "a"}],
+            "ds-b": [{"id": "exp-b", "name": "b"}],
+        }
+        exp_mig = Mock()
+        exp_mig.list_experiments = Mock(side_effect=lambda dataset_id: listings[dataset_id])
+        monkeypatch.setattr(
+            "langsmith_migrator.core.migrators.orchestrator.ExperimentMigrator",
+            Mock(return_value=exp_mig),
+        )
+        monkeypatch.setattr(
+            "langsmith_migrator.core.migrators.orchestrator.FeedbackMigrator", Mock()
+        )
+        orchestrator._resolve_experiment_item = Mock(return_value=(True, "migrated"))
+
+        orchestrator._migrate_experiments_for_datasets(["ds-a", "ds-b"], {"ds-a": "dest-ds-a"})
+
+        resolved = orchestrator._resolve_experiment_item.call_args_list
+        assert [c.args[:3] for c in resolved] == [(listings["ds-a"][0], "ds-a", "dest-ds-a")]
+        assert state.get_item("experiment_exp-b").metadata["source_dataset_id"] == "ds-b"
+        assert any(i.code == "missing_dataset_dependency" for i in state.issue_log)
+
+    def test_new_experiments_are_created_concurrently_before_replay(self, tmp_path, monkeypatch):
+        orchestrator, _ = _orchestrator(tmp_path)
+        orchestrator.config.migration.concurrent_workers = 2
+        state = orchestrator.ensure_state()
+        times = {"start_time": "2026-02-03T00:00:00+00:00", "end_time": "2026-02-03T01:00:00+00:00"}
+        experiments = [
+            {"id": "exp-1", "name": "one", **times},
+            {"id": "exp-2", "name": "two", **times},
+            {"id": "exp-3", "name": "one", **times},
+        ]
+        both_creating = threading.Barrier(2, timeout=5)
+
+        def create_experiment(experiment, dest_dataset_id, time_delta=None):
+            # Serial creation would never have both requests in flight.
+            both_creating.wait()
+            return f"dest-{experiment['id']}"
+
+        exp_mig = Mock()
+        exp_mig.list_experiments = Mock(return_value=experiments)
+        exp_mig.create_experiment = Mock(side_effect=create_experiment)
+        monkeypatch.setattr(
+            "langsmith_migrator.core.migrators.orchestrator.ExperimentMigrator",
+            Mock(return_value=exp_mig),
+        )
+        monkeypatch.setattr(
+            "langsmith_migrator.core.migrators.orchestrator.FeedbackMigrator", Mock()
+        )
+        orchestrator._resolve_experiment_item = Mock(return_value=(True, "migrated"))
+
+        orchestrator._migrate_experiments_for_datasets(["ds"], {"ds": "dest-ds"})
+
+        assert exp_mig.create_experiment.call_count == 2
+        assert state.get_item("experiment_exp-1").destination_id == "dest-exp-1"
+        assert state.get_item("experiment_exp-2").stage == "migrate_runs"
+        # A repeated name is left for the sequential pass to update, not duplicate.
+        assert state.get_item("experiment_exp-3").destination_id is None
+        assert orchestrator._resolve_experiment_item.call_count == 3
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import Mock
 
 from langsmith_migrator.core.api_client import EnhancedAPIClient
@@ -76,9 +77,9 @@ def test_migrate_runs_streaming_drops_unmapped_reference_example_id(
     dest.session = Mock()
     dest.session.headers = {}
 
-    def _dest_post(endpoint: str, payload: dict):
+    def _dest_post(endpoint: str, body: bytes):
         if endpoint == "/runs/batch":
-            captured_payloads.append(payload)
+            captured_payloads.append(json.loads(body))
             return {}
         raise AssertionError(f"Unexpected destination endpoint: {endpoint}")
 
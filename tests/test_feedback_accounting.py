@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import Mock
 
 import pytest
@@ -121,7 +122,14 @@ def test_source_query_failure_does_not_verify_a_partial_inventory(
 ):
     feedbacks = [_feedback(i) for i in range(100)]
     source, dest = _clients(feedbacks)
-    source.get.side_effect = [feedbacks, RuntimeError("connection reset")]
+
+    def _source_get(endpoint: str, params: dict | None = None):
+        # The first page is full, so the second page is requested and fails.
+        if params["offset"] == 0:
+            return feedbacks
+        raise RuntimeError("connection reset")
+
+    source.get.side_effect = _source_get
     migration_state.ensure_item(
         "experiment_exp-src", "experiment", "exp-1", "exp-src", stage="migrate_feedback"
     )
@@ -175,3 +183,58 @@ def test_create_failures_are_reported_and_retried_next_pass(sample_config, migra
     item = migration_state.get_item("experiment_exp-src")
     assert item.metadata["feedback_migrated"] == 2
     assert item.metadata.get("feedback_verified") is not True
+
+
+def test_feedback_batch_posts_concurrently_and_keeps_order(sample_config, migration_state):
+    sample_config.migration.concurrent_workers = 3
+    source, dest = _clients([])
+    all_posted = threading.Barrier(3, timeout=5)
+
+    def _post(endpoint: str, payload: dict):
+        # Serial posting would never get all three requests in flight.
+        all_posted.wait()
+        if payload["key"] == "bad":
+            raise RuntimeError("422")
+        return {}
+
+    dest.post.side_effect = _post
+    feedbacks = [{"key": "a"}, {"key": "bad"}, {"key": "c"}]
+
+    created, created_feedbacks = _migrator(
+        source, dest, sample_config, migration_state
+    ).create_feedback_batch(feedbacks)
+
+    assert created == 2
+    assert [fb["key"] for fb in created_feedbacks] == ["a", "c"]
+
+
+def test_session_listing_pages_in_order_and_stops_at_short_page(sample_config, migration_state):
+    records = [_feedback(i) for i in range(5)]
+    source, dest = _clients([])
+
+    def _source_get(endpoint: str, params: dict | None = None):
+        offset = params["offset"]
+        return records[offset:offset + params["limit"]]
+
+    source.get.side_effect = _source_get
+    migrator = _migrator(source, dest, sample_config, migration_state)
+
+    assert migrator.list_feedback_for_session("exp-src", limit=2) == records
+
+    # A short first page needs no further requests.
+    source.get.reset_mock()
+    assert migrator.list_feedback_for_session("exp-src", limit=10) == records
+    source.get.assert_called_once()
+
+
+def test_run_listing_queries_each_run_once(sample_config, migration_state):
+    source, dest = _clients([])
+    source.get.side_effect = lambda endpoint, params=None: []
+    run_ids = [f"run-{i}" for i in range(50)]
+
+    _migrator(source, dest, sample_config, migration_state).list_feedback_for_runs(
+        run_ids + run_ids[:10]
+    )
+
+    source.get.assert_called_once()
+    assert source.get.call_args.kwargs["params"]["run"] == ",".join(run_ids)
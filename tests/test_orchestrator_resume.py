@@ -5,6 +5,8 @@ from __future__ import annotations
 from types import SimpleNamespace
 from unittest.mock import Mock
 
+import pytest
+
 from langsmith_migrator.core.migrators.orchestrator import MigrationOrchestrator
 from langsmith_migrator.utils.state import (
     MigrationItem,
@@ -803,3 +805,83 @@ def test_resume_items_blocks_chart_when_stale_context_cannot_resolve_destination
     assert chart_item.terminal_state == ResolutionOutcome.BLOCKED_WITH_CHECKPOINT.value
     assert chart_item.outcome_code == "chart_resume_context_changed"
     assert "fresh `langsmith-migrator charts` run" in chart_item.next_action
+
+
+def test_parallel_dataset_migration_checkpoints_in_batches(
+    monkeypatch, sample_config, migration_state, tmp_path
+):
+    clients = [_FakeClient(), _FakeClient()]
+    monkeypatch.setattr(
+        "langsmith_migrator.core.migrators.orchestrator.EnhancedAPIClient",
+        lambda **kwargs: clients.pop(0),
+    )
+    dataset_migrator = Mock()
+    dataset_migrator.get_dataset.side_effect = lambda dataset_id: {"name": dataset_id}
+    dataset_migrator.migrate_dataset.side_effect = lambda dataset_id, include_examples: (
+        f"dest-{dataset_id}",
+        {f"{dataset_id}-ex": f"dest-{dataset_id}-ex"},
+    )
+    monkeypatch.setattr(
+        "langsmith_migrator.core.migrators.orchestrator.DatasetMigrator",
+        lambda *args, **kwargs: dataset_migrator,
+    )
+
+    state_manager = StateManager(tmp_path / "state")
+    orchestrator = MigrationOrchestrator(sample_config, state_manager)
+    orchestrator.state = migration_state
+    state_manager.save = Mock()
+    dataset_ids = [f"ds-{i}" for i in range(41)]
+
+    mapping = orchestrator.migrate_datasets_parallel(dataset_ids)
+
+    assert len(mapping) == 41
+    assert len(migration_state.id_mappings["examples"]) == 41
+    # Setup and submission saves, one per two completions, then the remainder.
+    assert state_manager.save.call_count == 2 + 20 + 1
+
+
+def test_parallel_dataset_migration_saves_unsaved_completions_on_interrupt(
+    monkeypatch, sample_config, migration_state, tmp_path
+):
+    clients = [_FakeClient(), _FakeClient()]
+    monkeypatch.setattr(
+        "langsmith_migrator.core.migrators.orchestrator.EnhancedAPIClient",
+        lambda **kwargs: clients.pop(0),
+    )
+    dataset_migrator = Mock()
+    dataset_migrator.get_dataset.side_effect = lambda dataset_id: {"name": dataset_id}
+    dataset_migrator.migrate_dataset.side_effect = lambda dataset_id, include_examples: (
+        f"dest-{dataset_id}",
+        {f"{dataset_id}-ex": f"dest-{dataset_id}-ex"},
+    )
+    monkeypatch.setattr(
+        "langsmith_migrator.core.migrators.orchestrator.DatasetMigrator",
+        lambda *args, **kwargs: dataset_migrator,
+    )
+
+    mark_terminal = migration_state.mark_terminal
+    marked = []
+
+    def interrupt_fifth_completion(*args, **kwargs):
+        marked.append(args[0])
+        if len(marked) == 5:
+            raise KeyboardInterrupt
+        return mark_terminal(*args, **kwargs)
+
+    monkeypatch.setattr(migration_state, "mark_terminal", interrupt_fifth_completion)
+
+    state_manager = StateManager(tmp_path / "state")
+    orchestrator = MigrationOrchestrator(sample_config, state_manager)
+    orchestrator.state = migration_state
+    saved_examples = []
+    state_manager.save = Mock(
+        side_effect=lambda: saved_examples.append(dict(migration_state.id_mappings.get("examples", {})))
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        orchestrator.migrate_datasets_parallel([f"ds-{i}" for i in range(60)])
+
+    # Checkpoints land every third completion, so the fourth finished after
+    # the last one and must still reach disk when the run is interrupted.
+    assert len(saved_examples[-1]) == 4
+    assert saved_examples[-1] == migration_state.id_mappings["examples"]